@@ -11,7 +11,7 @@ from .dialogue_generator import DialogueGenerator
 from .scaffolding_system import ScaffoldingSystem
 from .memory_manager import MemoryManager
 from .database_manager import DatabaseManager
-from .i18n import get_ui_text
+from .i18n import get_ui_text, get_ui_text_formatted, get_ui_text_getter, SUPPORTED_LANGUAGES
 from . import config
 
 __all__ = [
@@ -27,6 +27,8 @@ __all__ = [
     'MemoryManager',
     'DatabaseManager',
     'get_ui_text',
+    'get_ui_text_formatted',
+    'get_ui_text_getter',
     'get_tutor_text',
     'SUPPORTED_LANGUAGES',
     'config'
@@ -19,6 +19,9 @@ from . import config
 from .models import  ReasoningTriplet,MultidimensionalScores,EnhancedAnswerEvaluation
 from .prompts_template import get_enhanced_evaluation_prompt
 
+# Evaluation JSON in a ```json fence, or the first bare {...} object
+_EVALUATION_JSON_PATTERN = re.compile(r"```json\s*(\{.*?\})\s*```|(\{.*?\})", re.DOTALL)
+
 
 class AnswerEvaluator:
     """Handles student answer evaluation logic"""
@@ -108,7 +111,7 @@ class AnswerEvaluator:
         """
         try:
             # Attempt to parse JSON-like structure
-            json_match = re.search(r"```json\s*(\{.*?\})\s*```|(\{.*?\})", response_text, re.DOTALL)
+            json_match = _EVALUATION_JSON_PATTERN.search(response_text)
             if json_match:
                 json_str = json_match.group(1) if json_match.group(1) else json_match.group(2)
                 data = json.loads(json_str)
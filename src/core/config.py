@@ -12,10 +12,12 @@ DATA_IMAGES_DIR = os.path.join(PROJECT_ROOT, "data", "images")
 RAILWAY_VOLUME_PATH = os.getenv("RAILWAY_VOLUME_MOUNT_PATH", os.path.join(PROJECT_ROOT, "railway_data"))
 USER_UPLOADS_DIR = os.path.join(RAILWAY_VOLUME_PATH, "user_uploads")
 USER_INDEXES_DIR = os.path.join(RAILWAY_VOLUME_PATH, "user_indexes")
+CLASSIFIER_CACHE_DIR = os.path.join(RAILWAY_VOLUME_PATH, "classifier_cache")
 
 # 디렉토리 생성
 os.makedirs(USER_UPLOADS_DIR, exist_ok=True)
 os.makedirs(USER_INDEXES_DIR, exist_ok=True)
+os.makedirs(CLASSIFIER_CACHE_DIR, exist_ok=True)
 os.makedirs(RAILWAY_VOLUME_PATH, exist_ok=True)
 
 # Model configurations
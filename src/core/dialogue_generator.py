@@ -24,6 +24,8 @@ from .models import(
 )
 from .prompts_template import get_adaptive_tutor_template, get_adaptive_strategy_instructions, get_scaffolding_prompt
 from .i18n import get_ui_text
+from .memory_manager import ROLE_LABELS
+
 
 class DialogueGenerator:
     """Handles Socratic dialogue generation"""
@@ -289,7 +291,7 @@ class DialogueGenerator:
             # Format recent messages (last 6 for context)
             history_parts = []
             for msg in recent_messages[-6:]:
-                role = "Student" if msg.role == MessageRole.USER else "Tutor"
+                role = ROLE_LABELS.get(msg.role, "Tutor")
                 content = msg.content[:200] + "..." if len(msg.content) > 200 else msg.content
                 history_parts.append(f"{role}: {content}")
             
@@ -6,29 +6,238 @@ Handles Stage 0 and Stage 0b classification logic:
 - Stage 0: new_question vs follow_up
 - Stage 0b: answer vs meta_question
 - stage 0c: meta_question type classification
+- Stage 0 + 0b combined into a single LLM call for follow-up capable turns
 """
 
+import atexit
+import hashlib
+import json
 import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.llms.google_genai import GoogleGenAI
 from . import config
-from .prompts_template import  get_intent_classifier_prompt,get_follow_up_type_classifier_prompt, get_meta_question_classifier_prompt
+from .prompts_template import  get_intent_classifier_prompt,get_follow_up_type_classifier_prompt, get_meta_question_classifier_prompt, get_combined_intent_prompt
+from .prompts_template import INTENT_CLASSIFIER_PROMPT, FOLLOW_UP_TYPE_CLASSIFIER_PROMPT, COMBINED_INTENT_CLASSIFIER_PROMPT
+from .memory_manager import ROLE_LABELS
+
+
+# Stage 0 fast path: short acknowledgements continue the current topic,
+# interrogatives unrelated to the last tutor message open a new one
+_ACKNOWLEDGEMENTS = frozenset({
+    "hi", "hello", "ok", "okay", "yes", "no", "sure", "thanks",
+    "ciao", "sì", "si", "certo", "grazie",
+})
+_INTERROGATIVES = frozenset({
+    "what", "how", "why", "when", "where", "which", "who",
+    "cosa", "come", "perché", "perche", "quando", "dove", "quale", "quali", "chi",
+})
+_WORD_PATTERN = re.compile(r"\w+")
+# Function words ignored when comparing a question with the last tutor message
+_STOPWORDS = _INTERROGATIVES | frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been", "do", "does", "did",
+    "can", "could", "would", "should", "will", "it", "its", "this", "that", "these",
+    "those", "of", "in", "on", "at", "to", "for", "from", "with", "by", "and", "or",
+    "if", "so", "then", "than", "there", "i", "you", "we", "they", "he", "she", "me",
+    "my", "your", "our", "their", "not", "about", "into", "get", "gets", "happen", "happens",
+    "il", "lo", "la", "gli", "le", "un", "uno", "una", "di", "da", "con", "su",
+    "per", "tra", "fra", "e", "o", "che", "non", "è", "sono", "del", "della", "dei",
+    "delle", "nel", "nella", "al", "alla", "mi", "ti", "si", "ci", "questo", "questa",
+})
+# Content words are compared by this many leading characters, so that
+# "compressed" matches "compression" without a stemmer
+_TOPIC_WORD_PREFIX = 5
+# Share of a question's content words that must appear in the last tutor
+# message for it to be treated as possibly on topic
+_MIN_TOPIC_CONTAINMENT = 0.2
+# Follow-up type labels, found in one scan of the response
+_FOLLOW_UP_LABEL_PATTERN = re.compile(r"meta_question|meta|answer")
+# First JSON object in a combined classification response
+_JSON_OBJECT_PATTERN = re.compile(r"\{.*?\}", re.DOTALL)
+
+
+def _topic_words(tokens) -> set:
+    """Content words of a tokenized message, cut to _TOPIC_WORD_PREFIX characters"""
+    return {token[:_TOPIC_WORD_PREFIX] for token in tokens if token not in _STOPWORDS}
+
+
+class _LabelCache:
+    """
+    Bounded LRU cache of classification labels.
+    
+    Keys are digests of whitespace/case-normalized conversation text so that
+    repeated turns (e.g. "I don't understand") skip the LLM round-trip without
+    the conversation itself being kept. When a path is given, entries are
+    persisted there every `save_every` inserts and reloaded on startup if the
+    version tag still matches.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None,
+                 version: str = "", save_every: int = 32):
+        self.maxsize = maxsize
+        self.path = path
+        self.version = version
+        self.save_every = save_every
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes writers of the file (put() and the atexit hook)
+        self._save_lock = threading.Lock()
+        self._unsaved = 0
+        if path:
+            self.load()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from a digest of the normalized text parts"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            normalized = " ".join(part.lower().split()).encode("utf-8")
+            # Length prefix keeps ("ab", "c") and ("a", "bc") apart
+            digest.update(len(normalized).to_bytes(4, "big"))
+            digest.update(normalized)
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            label = self._entries.get(key)
+            if label is not None:
+                self._entries.move_to_end(key)
+            return label
+
+    def put(self, key: str, label: str) -> None:
+        with self._lock:
+            self._entries[key] = label
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            should_save = self.path is not None and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+
+    def load(self) -> None:
+        """Reload persisted entries, ignoring files written for another version"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Could not load classification cache {self.path}: {e}")
+            return
+        
+        if data.get("version") != self.version:
+            return
+        with self._lock:
+            for key, label in data.get("entries", [])[-self.maxsize:]:
+                self._entries[key] = label
+
+    def save(self) -> None:
+        """Write entries to disk atomically"""
+        if self.path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                entries = list(self._entries.items())
+                self._unsaved = 0
+            
+            tmp_path = None
+            try:
+                # Unique temporary file, so other processes sharing the cache
+                # file cannot interleave their writes with this one
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(self.path) or ".", suffix=".tmp"
+                )
+                with open(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": self.version, "entries": entries}, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"Could not save classification cache {self.path}: {e}")
+                if tmp_path is not None and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+
+# Revision of what the caches may contain; bumped to discard caches saved before
+# fallback labels for unparseable responses stopped being cached (2) and before
+# keys were hashed instead of holding conversation text (3)
+_CACHE_REVISION = 3
+
+
+def _cache_version(*templates) -> str:
+    """Version tag that changes whenever the model, a classifier prompt or the cache revision changes"""
+    digest = hashlib.blake2b(config.GEMINI_MODEL_NAME.encode("utf-8"), digest_size=8)
+    digest.update(str(_CACHE_REVISION).encode("utf-8"))
+    for template in templates:
+        digest.update(template.template.encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Process-wide caches, shared by every session's classifier and kept across restarts
+_INTENT_CACHE = _LabelCache(
+    path=os.path.join(config.CLASSIFIER_CACHE_DIR, "intent_cache.json"),
+    version=_cache_version(INTENT_CLASSIFIER_PROMPT, COMBINED_INTENT_CLASSIFIER_PROMPT),
+)
+_FOLLOW_UP_TYPE_CACHE = _LabelCache(
+    path=os.path.join(config.CLASSIFIER_CACHE_DIR, "follow_up_type_cache.json"),
+    version=_cache_version(FOLLOW_UP_TYPE_CLASSIFIER_PROMPT, COMBINED_INTENT_CLASSIFIER_PROMPT),
+)
+atexit.register(_INTENT_CACHE.save)
+atexit.register(_FOLLOW_UP_TYPE_CACHE.save)
+
+
+@lru_cache(maxsize=1)
+def _get_llm() -> GoogleGenAI:
+    """
+    Get the shared classification LLM client.
+    
+    Built once per process so every session reuses the same client and
+    its connections.
+    """
+    return GoogleGenAI(
+        model_name=config.GEMINI_MODEL_NAME,
+        api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0.2
+    )
 
 
 class IntentClassifier:
     """Handles all intent classification logic"""
     
+    # Meta-question indicators for the heuristic fallback (lowercase)
+    _META_INDICATORS = {
+        "en": (
+            "don't know", "not sure", "confused", "what do you mean",
+            "can you explain", "help", "hint", "stuck", "lost",
+            "unclear", "don't understand", "more detail"
+        ),
+        "it": (
+            "non so", "non sono sicuro", "confuso", "cosa intendi",
+            "puoi spiegare", "aiuto", "suggerimento", "bloccato", "perso",
+            "poco chiaro", "non capisco", "più dettagli", "più informazioni", "spiegazione",
+            "chiarimento", "aiutami", "aiuto per capire", "domanda"
+        )
+    }
+    # One alternation per language, compiled once for all instances
+    _META_INDICATOR_PATTERNS = {
+        lang: re.compile("|".join(
+            re.escape(indicator)
+            for indicator in sorted(set(indicators), key=len, reverse=True)
+        ))
+        for lang, indicators in _META_INDICATORS.items()
+    }
+    
     def __init__(self):
         """
         Initialize IntentClassifier with Google GenAI LLM.
         
         Sets up the language model for intent classification tasks.
         """
-        self.llm = GoogleGenAI(
-            model_name=config.GEMINI_MODEL_NAME,
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.2
-        )
+        self.llm = _get_llm()
 
     def classify_intent(self, user_input: str, memory, language: str = "en") -> str:
         """
@@ -36,88 +245,340 @@ class IntentClassifier:
         
         Args:
             user_input: Current user message
-            memory: ChatMemoryBuffer with conversation history
+            memory: MemoryManager with conversation history
             
         Returns:
             str: "new_question" or "follow_up"
         """
         try:
-            # Get recent conversation history
-            recent_messages = memory.get_all()
-            if len(recent_messages) < 2:
-                return "new_question"
-            
-            # Format conversation history for prompt
-            history_messages = []
-            for msg in recent_messages[-6:]:  # Last 6 messages for context
-                role = "Student" if msg.role == MessageRole.USER else "Tutor"
-                history_messages.append(f"{role}: {msg.content}")
-            
-            conversation_history_str = "\n".join(history_messages)
-            
-            # Create classification prompt
-            prompt_template = get_intent_classifier_prompt(language)
-            prompt = prompt_template.format(
-                conversation_history=conversation_history_str,
-                user_input=user_input
-            )
+            intent, cache_key, prompt = self._prepare_intent_request(user_input, memory, language)
+            if intent is not None:
+                return intent
             
             # Get LLM response
             response = self.llm.complete(prompt)
             
             # 강화된 파싱 사용
-            return self._parse_intent_response(response.text)
+            intent, parsed = self._parse_intent_response(response.text)
+            if parsed:
+                _INTENT_CACHE.put(cache_key, intent)
+            return intent
             
         except Exception as e:
             print(f"Intent classification error: {e}")
             return "new_question"  # Safe default
 
+    async def aclassify_intent(self, user_input: str, memory, language: str = "en") -> str:
+        """
+        Async variant of classify_intent that does not block the event loop.
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            str: "new_question" or "follow_up"
+        """
+        try:
+            intent, cache_key, prompt = self._prepare_intent_request(user_input, memory, language)
+            if intent is not None:
+                return intent
+            
+            response = await self.llm.acomplete(prompt)
+            
+            intent, parsed = self._parse_intent_response(response.text)
+            if parsed:
+                _INTENT_CACHE.put(cache_key, intent)
+            return intent
+            
+        except Exception as e:
+            print(f"Intent classification error: {e}")
+            return "new_question"  # Safe default
+
+    def _prepare_intent_request(self, user_input: str, memory, language: str):
+        """
+        Build the Stage 0 prompt, or return the label directly when no LLM call is needed.
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (intent or None, cache key, prompt or None)
+        """
+        intent, cache_key = self._lookup_intent(user_input, memory, language)
+        if intent is not None:
+            return intent, cache_key, None
+        
+        # Create classification prompt
+        prompt_template = get_intent_classifier_prompt(language)
+        prompt = prompt_template.format(
+            conversation_history=self._format_history(memory),
+            user_input=user_input
+        )
+        return None, cache_key, prompt
+
+    def _lookup_intent(self, user_input: str, memory, language: str):
+        """
+        Resolve Stage 0 from the conversation state, heuristics or cache.
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (intent or None, cache key or None)
+        """
+        if memory.get_message_count() < 2:
+            return "new_question", None
+        
+        last_tutor_message = memory.get_last_assistant() or ""
+        heuristic_intent = self._heuristic_intent(
+            user_input, last_tutor_message, language, memory.has_cached_context()
+        )
+        if heuristic_intent is not None:
+            return heuristic_intent, None
+        
+        # Reuse the label of an identical (tutor message, student input) turn
+        cache_key = _LabelCache.make_key(language, last_tutor_message, user_input)
+        return _INTENT_CACHE.get(cache_key), cache_key
+
+    def _format_history(self, memory) -> str:
+        """Format the last 6 messages for classifier prompts"""
+        history_messages = []
+        for msg_role, msg_content, _ in memory.get_recent_tuples(6):
+            history_messages.append(f"{ROLE_LABELS.get(msg_role, 'Tutor')}: {msg_content}")
+        
+        return "\n".join(history_messages)
+
+    def classify_both(self, user_input: str, memory, language: str = "en") -> Tuple[str, Optional[str]]:
+        """
+        Stage 0 + Stage 0b: Classify intent and follow-up type in one LLM call
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (intent, follow-up type or None if not a follow-up / not determined)
+        """
+        try:
+            intent, cache_keys, prompt = self._prepare_combined_request(user_input, memory, language)
+            if intent == "follow_up":
+                return intent, self.classify_follow_up_type(user_input, memory, language)
+            if intent is not None:
+                return intent, None
+            
+            response = self.llm.complete(prompt)
+            return self._store_combined_result(response.text, cache_keys)
+            
+        except Exception as e:
+            print(f"Combined intent classification error: {e}")
+            return "new_question", None  # Safe default
+
+    async def aclassify_both(self, user_input: str, memory, language: str = "en") -> Tuple[str, Optional[str]]:
+        """
+        Async variant of classify_both that does not block the event loop.
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (intent, follow-up type or None if not a follow-up / not determined)
+        """
+        try:
+            intent, cache_keys, prompt = self._prepare_combined_request(user_input, memory, language)
+            if intent == "follow_up":
+                return intent, await self.aclassify_follow_up_type(user_input, memory, language)
+            if intent is not None:
+                return intent, None
+            
+            response = await self.llm.acomplete(prompt)
+            return self._store_combined_result(response.text, cache_keys)
+            
+        except Exception as e:
+            print(f"Combined intent classification error: {e}")
+            return "new_question", None  # Safe default
+
+    def _prepare_combined_request(self, user_input: str, memory, language: str):
+        """
+        Build the combined Stage 0 + 0b prompt, or return the intent when Stage 0 needs no LLM call.
+        
+        Args:
+            user_input: Current user message
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (intent or None, (intent cache key, follow-up type cache key), prompt or None)
+        """
+        intent, intent_key = self._lookup_intent(user_input, memory, language)
+        if intent is not None:
+            return intent, (intent_key, None), None
+        
+        tutor_question = memory.get_last_assistant() or "No previous question found."
+        follow_up_key = _LabelCache.make_key(language, tutor_question, user_input)
+        
+        prompt_template = get_combined_intent_prompt(language)
+        prompt = prompt_template.format(
+            conversation_history=self._format_history(memory),
+            tutor_question=tutor_question,
+            user_input=user_input
+        )
+        return None, (intent_key, follow_up_key), prompt
+
+    def _store_combined_result(self, response_text: str, cache_keys: tuple) -> Tuple[str, Optional[str]]:
+        """Parse a combined classification response and cache the labels that were parsed"""
+        intent, intent_parsed, follow_up_type, follow_up_parsed = self._parse_combined_response(response_text)
+        intent_key, follow_up_key = cache_keys
+        if intent_parsed:
+            _INTENT_CACHE.put(intent_key, intent)
+        if follow_up_parsed:
+            _FOLLOW_UP_TYPE_CACHE.put(follow_up_key, follow_up_type)
+        return intent, follow_up_type
+
+    def _heuristic_intent(self, user_input: str, last_tutor_message: str, language: str,
+                          has_topic_context: bool = False) -> Optional[str]:
+        """
+        Classify trivially recognizable turns without calling the LLM.
+        
+        Args:
+            user_input: Current user message
+            last_tutor_message: Most recent tutor message
+            language: Language code for classification
+            has_topic_context: Whether a topic's retrieval context is cached; a
+                question is then never declared new without asking the LLM
+            
+        Returns:
+            Optional[str]: "new_question", "follow_up", or None if undecided
+        """
+        tokens = _WORD_PATTERN.findall(user_input.lower())
+        if not tokens:
+            return None
+        
+        if tokens[0] in _ACKNOWLEDGEMENTS and len(tokens) <= 3:
+            return "follow_up"
+        
+        if tokens[0] in _INTERROGATIVES and len(tokens) >= 3 and not has_topic_context:
+            # "What do you mean?" and the like are about the current topic
+            pattern = self._META_INDICATOR_PATTERNS.get(language, self._META_INDICATOR_PATTERNS["en"])
+            if pattern.search(user_input.lower()):
+                return None
+            
+            # Containment rather than Jaccard similarity: the tutor's message is
+            # usually much longer than the question and must not dilute the score
+            input_words = _topic_words(tokens)
+            if not input_words:
+                return None
+            tutor_words = _topic_words(_WORD_PATTERN.findall(last_tutor_message.lower()))
+            containment = len(input_words & tutor_words) / len(input_words)
+            if containment < _MIN_TOPIC_CONTAINMENT:
+                return "new_question"
+        
+        return None
+
     def classify_follow_up_type(self, user_input: str, memory, language: str = "en") -> str:
         """
         Stage 0b: Classify follow-up type as 'answer' or 'meta_question'
         
         Args:
             user_input: Student's follow-up response
-            memory: ChatMemoryBuffer with conversation history
+            memory: MemoryManager with conversation history
             
         Returns:
             str: "answer" or "meta_question"
         """
         try:
-            # Get the last tutor question from memory
-            recent_messages = memory.get_all()
-            
-            # Find the most recent tutor message (should be a question)
-            tutor_question = "No previous question found."
-            for msg in reversed(recent_messages):
-                if msg.role == MessageRole.ASSISTANT:
-                    tutor_question = msg.content
-                    break
-            
-            # Create classification prompt
-            prompt_template = get_follow_up_type_classifier_prompt(language)
-            prompt = prompt_template.format(
-                tutor_question=tutor_question,
-                student_response=user_input
+            follow_up_type, cache_key, prompt = self._prepare_follow_up_type_request(
+                user_input, memory, language
             )
+            if follow_up_type is not None:
+                return follow_up_type
             
             # Get LLM response
             response = self.llm.complete(prompt)
             
             # 강화된 파싱 사용
-            return self._parse_follow_up_type_response(response.text)
+            follow_up_type, parsed = self._parse_follow_up_type_response(response.text)
+            if parsed:
+                _FOLLOW_UP_TYPE_CACHE.put(cache_key, follow_up_type)
+            return follow_up_type
+            
+        except Exception as e:
+            print(f"Follow-up classification error: {e}")
+            return self._fallback_classification(user_input, language)
+
+    async def aclassify_follow_up_type(self, user_input: str, memory, language: str = "en") -> str:
+        """
+        Async variant of classify_follow_up_type that does not block the event loop.
+        
+        Args:
+            user_input: Student's follow-up response
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            str: "answer" or "meta_question"
+        """
+        try:
+            follow_up_type, cache_key, prompt = self._prepare_follow_up_type_request(
+                user_input, memory, language
+            )
+            if follow_up_type is not None:
+                return follow_up_type
+            
+            response = await self.llm.acomplete(prompt)
+            
+            follow_up_type, parsed = self._parse_follow_up_type_response(response.text)
+            if parsed:
+                _FOLLOW_UP_TYPE_CACHE.put(cache_key, follow_up_type)
+            return follow_up_type
             
         except Exception as e:
             print(f"Follow-up classification error: {e}")
             return self._fallback_classification(user_input, language)
 
+    def _prepare_follow_up_type_request(self, user_input: str, memory, language: str):
+        """
+        Build the Stage 0b prompt, or return the cached label for this turn.
+        
+        Args:
+            user_input: Student's follow-up response
+            memory: MemoryManager with conversation history
+            language: Language code for classification
+            
+        Returns:
+            tuple: (follow-up type or None, cache key, prompt or None)
+        """
+        # Get the last tutor question from memory (should be a question)
+        tutor_question = memory.get_last_assistant() or "No previous question found."
+        
+        cache_key = _LabelCache.make_key(language, tutor_question, user_input)
+        cached_type = _FOLLOW_UP_TYPE_CACHE.get(cache_key)
+        if cached_type is not None:
+            return cached_type, cache_key, None
+        
+        # Create classification prompt
+        prompt_template = get_follow_up_type_classifier_prompt(language)
+        prompt = prompt_template.format(
+            tutor_question=tutor_question,
+            student_response=user_input
+        )
+        return None, cache_key, prompt
+
     def classify_meta_question_type(self, user_input: str, memory, language: str = "en") -> str:
         """
         Stage 0c: Classify type of meta question for appropriate response.
         
         Args:
             user_input: Student's meta question
-            memory: ChatMemoryBuffer with conversation history
+            memory: MemoryManager with conversation history
             language: Language code for classification
             
         Returns:
@@ -125,13 +586,7 @@ class IntentClassifier:
         """
 
         try:
-            recent_messages= memory.get_all()
-            tutor_question = "No previous question found."
-
-            for msg in reversed(recent_messages):
-                if msg.role == MessageRole.ASSISTANT:
-                    tutor_question = msg.content
-                    break
+            tutor_question = memory.get_last_assistant() or "No previous question found."
             
             prompt_template = get_meta_question_classifier_prompt(language)
             prompt = prompt_template.format(
@@ -168,62 +623,54 @@ class IntentClassifier:
             str: "answer" or "meta_question"
         """
         # Simple heuristics for classification
-        meta_indicators = {
-            "en": [
-                "don't know", "not sure", "confused", "what do you mean",
-                "can you explain", "help", "hint", "stuck", "lost",
-                "unclear", "don't understand", "more detail"
-            ],
-            "it": [
-                "non so", "non sono sicuro", "confuso", "cosa intendi",
-                "puoi spiegare", "aiuto", "suggerimento", "bloccato", "perso",
-                "poco chiaro", "non capisco", "più dettagli", "più informazioni", "spiegazione",
-                "chiarimento", "aiutami", "aiuto per capire", "domanda"
-            ]
-        }
-        indicators = meta_indicators.get(language, meta_indicators["en"])
-        user_lower = user_input.lower()
+        pattern = self._META_INDICATOR_PATTERNS.get(language, self._META_INDICATOR_PATTERNS["en"])
         
         # Check for meta-question indicators
-        for indicator in indicators:
-            if indicator in user_lower:
-                return "meta_question"
+        if pattern.search(user_input.lower()):
+            return "meta_question"
         
         # Check for very short responses (likely confusion)
-        if len(user_input.strip()) < 10:
-            words = user_input.strip().split()
+        stripped_input = user_input.strip()
+        if len(stripped_input) < 10:
+            words = stripped_input.split()
             if len(words) <= 2:
                 return "meta_question"
         
         # Default to answer attempt
         return "answer"
     
-    def _parse_intent_response(self, response_text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_intent_response(response_text: str) -> Tuple[str, bool]:
         """
         Enhanced parsing for intent classification with fallback strategies.
         
+        Memoized, since the classifier only ever answers with a handful of
+        distinct strings.
+        
         Args:
             response_text: Raw LLM response to parse
             
         Returns:
-            str: Parsed intent ("new_question" or "follow_up")
+            tuple: (intent "new_question" or "follow_up", False if the response
+            could not be parsed and the intent is the default)
         """
         response_lower = response_text.lower().strip()
         
         # 1차: 정확한 영어 키워드 매칭
         if "new_question" in response_lower:
-            return "new_question"
+            return "new_question", True
         elif "follow_up" in response_lower:
-            return "follow_up"
+            return "follow_up", True
         
         # 2차: 변형 케이스 처리
         new_question_variants = ["new question", "newquestion", "new-question", "new_topic", "different question"]
         follow_up_variants = ["follow up", "followup", "follow-up", "continuation", "continue", "same topic"]
         
         if any(variant in response_lower for variant in new_question_variants):
-            return "new_question"
+            return "new_question", True
         elif any(variant in response_lower for variant in follow_up_variants):
-            return "follow_up"
+            return "follow_up", True
         
         # 3차: 이탈리아어 대비책 (혹시 모르는 상황)
         italian_mappings = {
@@ -237,38 +684,44 @@ class IntentClassifier:
         for italian_key, english_value in italian_mappings.items():
             if italian_key in response_lower:
                 print(f"WARNING: Found Italian keyword '{italian_key}', mapping to '{english_value}'")
-                return english_value
+                return english_value, True
         
         # 최종 폴백
         print(f"WARNING: Could not parse intent response: '{response_text}', defaulting to 'new_question'")
-        return "new_question"
+        return "new_question", False
 
-    def _parse_follow_up_type_response(self, response_text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_follow_up_type_response(response_text: str) -> Tuple[str, bool]:
         """
         Enhanced parsing for follow-up type classification with fallback strategies.
         
+        Memoized like _parse_intent_response.
+        
         Args:
             response_text: Raw LLM response to parse
             
         Returns:
-            str: Parsed follow-up type ("answer" or "meta_question")
+            tuple: (follow-up type "answer" or "meta_question", False if the
+            response could not be parsed and the type is the default)
         """
         response_lower = response_text.lower().strip()
         
-        # 1차: 정확한 키워드
-        if "answer" in response_lower and "meta" not in response_lower:
-            return "answer"
-        elif "meta_question" in response_lower:
-            return "meta_question"
+        # 1차: 정확한 키워드 (한 번의 스캔으로 모두 수집)
+        found_labels = set(_FOLLOW_UP_LABEL_PATTERN.findall(response_lower))
+        if "answer" in found_labels and "meta" not in found_labels and "meta_question" not in found_labels:
+            return "answer", True
+        elif "meta_question" in found_labels:
+            return "meta_question", True
         
         # 2차: 변형 처리
         answer_variants = ["response", "reply", "attempt", "trying to answer"]
         meta_variants = ["help", "confused", "clarify", "explain", "meta question", "meta-question"]
         
         if any(variant in response_lower for variant in answer_variants):
-            return "answer"
+            return "answer", True
         elif any(variant in response_lower for variant in meta_variants):
-            return "meta_question"
+            return "meta_question", True
         
         # 3차: 이탈리아어 대비책
         italian_mappings = {
@@ -283,8 +736,38 @@ class IntentClassifier:
         for italian_key, english_value in italian_mappings.items():
             if italian_key in response_lower:
                 print(f"WARNING: Found Italian keyword '{italian_key}', mapping to '{english_value}'")
-                return english_value
+                return english_value, True
         
         # 최종 폴백
         print(f"WARNING: Could not parse follow-up type: '{response_text}', defaulting to 'meta_question'")
-        return "meta_question"
+        return "meta_question", False
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_combined_response(response_text: str) -> Tuple[str, bool, Optional[str], bool]:
+        """
+        Parse the combined Stage 0 + 0b classification response.
+        
+        Args:
+            response_text: Raw LLM response to parse
+            
+        Returns:
+            tuple: (intent, whether the intent was parsed, follow-up type or None
+            if not a follow-up / not parseable, whether the follow-up type was parsed)
+        """
+        match = _JSON_OBJECT_PATTERN.search(response_text)
+        try:
+            labels = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            labels = None
+        
+        if not isinstance(labels, dict):
+            # No usable JSON: recover the intent, leave Stage 0b to a separate call
+            print(f"WARNING: Could not parse combined classification: '{response_text}'")
+            return (*IntentClassifier._parse_intent_response(response_text), None, False)
+        
+        intent, intent_parsed = IntentClassifier._parse_intent_response(str(labels.get("intent", "")))
+        follow_up_type = str(labels.get("follow_up_type", "")).strip().lower()
+        if intent != "follow_up" or follow_up_type in ("", "n/a"):
+            return intent, intent_parsed, None, False
+        return (intent, intent_parsed, *IntentClassifier._parse_follow_up_type_response(follow_up_type))
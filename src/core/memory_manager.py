@@ -8,13 +8,32 @@ Handles conversation memory and context caching:
 - Memory persistence and cleanup
 """
 
+from collections import deque
+from itertools import islice
+
 from llama_index.core.memory import ChatMemoryBuffer
 from llama_index.core.llms import ChatMessage, MessageRole
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .models import ReasoningTriplet
 
 
+# Number of recent messages mirrored outside the ChatMemoryBuffer for cheap tail reads
+RECENT_WINDOW_SIZE = 32
+# Maximum characters of a message shown in formatted conversation context
+CONTEXT_MESSAGE_CHARS = 200
+# Display names for conversation roles in formatted prompts; also used by the
+# intent classifier, dialogue generator and RAG retriever when they format history
+ROLE_LABELS = {MessageRole.USER: "Student", MessageRole.ASSISTANT: "Tutor"}
+
+
+def _to_display_content(message: str) -> str:
+    """Truncate long messages for conversation context"""
+    if len(message) <= CONTEXT_MESSAGE_CHARS:
+        return message
+    return message[:CONTEXT_MESSAGE_CHARS] + "..."
+
+
 class MemoryManager:
     """Manages conversation memory and context caching"""
     
@@ -26,16 +45,21 @@ class MemoryManager:
             token_limit: Maximum token limit for conversation memory buffer
         """
         self.memory = ChatMemoryBuffer.from_defaults(token_limit=token_limit)
+        # Bounded (role, content, display_content) mirror of the latest messages
+        self._recent: deque = deque(maxlen=RECENT_WINDOW_SIZE)
+        self._last_assistant_content: Optional[str] = None
+        # Running message statistics, kept in step with the buffer
+        self._stats: Dict[str, int] = {"user_msgs": 0, "assistant_msgs": 0, "total_chars": 0}
         
         # Context caching for current topic
         self.current_topic_triplet: Optional[ReasoningTriplet] = None
         self.current_topic_source_nodes: Optional[List] = None
         self.stuck_count: int = 0
         
-        # Session metadata
+        # Session metadata (topics_covered is an insertion-ordered dict used as a set)
         self.session_metadata: Dict[str, Any] = {
             "total_interactions": 0,
-            "topics_covered": [],
+            "topics_covered": {},
             "scaffolding_instances": 0
         }
     
@@ -49,6 +73,9 @@ class MemoryManager:
         try:
             chat_message = ChatMessage(role=MessageRole.USER, content=message)
             self.memory.put(chat_message)
+            self._recent.append((MessageRole.USER, message, _to_display_content(message)))
+            self._stats["user_msgs"] += 1
+            self._stats["total_chars"] += len(message)
             self.session_metadata["total_interactions"] += 1
             
         except Exception as e:
@@ -64,6 +91,10 @@ class MemoryManager:
         try:
             chat_message = ChatMessage(role=MessageRole.ASSISTANT, content=message)
             self.memory.put(chat_message)
+            self._recent.append((MessageRole.ASSISTANT, message, _to_display_content(message)))
+            self._last_assistant_content = message
+            self._stats["assistant_msgs"] += 1
+            self._stats["total_chars"] += len(message)
             
         except Exception as e:
             print(f"Error adding assistant message to memory: {e}")
@@ -88,6 +119,39 @@ class MemoryManager:
             print(f"Error retrieving conversation history: {e}")
             return []
     
+    def get_recent_tuples(self, last_n: int = None) -> List[Tuple[MessageRole, str, str]]:
+        """
+        Get the most recent messages without materializing the full history
+        
+        Args:
+            last_n: Number of recent messages to retrieve (None for the whole recent window)
+            
+        Returns:
+            List[Tuple[MessageRole, str, str]]: (role, content, display_content) tuples, oldest first
+        """
+        size = len(self._recent)
+        if last_n is None or last_n >= size:
+            return list(self._recent)
+        return list(islice(self._recent, size - last_n, size))
+    
+    def get_message_count(self) -> int:
+        """
+        Get the number of messages in the conversation
+        
+        Returns:
+            int: Total user and assistant messages
+        """
+        return self._stats["user_msgs"] + self._stats["assistant_msgs"]
+    
+    def get_last_assistant(self) -> Optional[str]:
+        """
+        Get the most recent tutor message
+        
+        Returns:
+            Optional[str]: Last assistant message content, or None if the tutor has not spoken yet
+        """
+        return self._last_assistant_content
+    
     def format_conversation_context(self, last_n: int = 6) -> str:
         """
         Format recent conversation for use in prompts
@@ -99,20 +163,16 @@ class MemoryManager:
             str: Formatted conversation context
         """
         try:
-            recent_messages = self.get_conversation_history(last_n)
+            recent_messages = self.get_recent_tuples(last_n)
             
             if not recent_messages:
                 return "This is the start of our conversation."
             
-            # Format messages
-            formatted_parts = []
-            for msg in recent_messages:
-                role = "Student" if msg.role == MessageRole.USER else "Tutor"
-                # Truncate long messages for context
-                content = msg.content[:200] + "..." if len(msg.content) > 200 else msg.content
-                formatted_parts.append(f"{role}: {content}")
-            
-            return "\n".join(formatted_parts)
+            # Format messages (long messages were already truncated when stored)
+            return "\n".join(
+                f"{ROLE_LABELS.get(msg_role, 'Tutor')}: {display_content}"
+                for msg_role, _, display_content in recent_messages
+            )
             
         except Exception as e:
             print(f"Error formatting conversation context: {e}")
@@ -133,8 +193,7 @@ class MemoryManager:
             # Add to topics covered
             if triplet and triplet.question:
                 topic_summary = triplet.question[:50] + "..." if len(triplet.question) > 50 else triplet.question
-                if topic_summary not in self.session_metadata["topics_covered"]:
-                    self.session_metadata["topics_covered"].append(topic_summary)
+                self.session_metadata["topics_covered"].setdefault(topic_summary, None)
                     
         except Exception as e:
             print(f"Error caching topic context: {e}")
@@ -186,6 +245,9 @@ class MemoryManager:
         """Clear conversation memory"""
         try:
             self.memory.reset()
+            self._recent.clear()
+            self._last_assistant_content = None
+            self._stats = {"user_msgs": 0, "assistant_msgs": 0, "total_chars": 0}
             
         except Exception as e:
             print(f"Error clearing conversation memory: {e}")
@@ -202,7 +264,7 @@ class MemoryManager:
             # Reset metadata
             self.session_metadata = {
                 "total_interactions": 0,
-                "topics_covered": [],
+                "topics_covered": {},
                 "scaffolding_instances": 0
             }
             
@@ -217,10 +279,11 @@ class MemoryManager:
             Dict: Session summary with statistics
         """
         try:
-            conversation_length = len(self.get_conversation_history())
+            conversation_length = self.get_message_count()
             
             summary = {
                 **self.session_metadata,
+                "topics_covered": list(self.session_metadata["topics_covered"]),
                 "conversation_length": conversation_length,
                 "has_cached_context": self.has_cached_context(),
                 "current_stuck_count": self.stuck_count
@@ -240,18 +303,17 @@ class MemoryManager:
             Dict: Memory usage stats
         """
         try:
-            all_messages = self.get_conversation_history()
-            
-            total_chars = sum(len(msg.content) for msg in all_messages)
-            user_messages = [msg for msg in all_messages if msg.role == MessageRole.USER]
-            assistant_messages = [msg for msg in all_messages if msg.role == MessageRole.ASSISTANT]
+            user_messages = self._stats["user_msgs"]
+            assistant_messages = self._stats["assistant_msgs"]
+            total_messages = user_messages + assistant_messages
+            total_chars = self._stats["total_chars"]
             
             return {
-                "total_messages": len(all_messages),
-                "user_messages": len(user_messages),
-                "assistant_messages": len(assistant_messages),
+                "total_messages": total_messages,
+                "user_messages": user_messages,
+                "assistant_messages": assistant_messages,
                 "total_characters": total_chars,
-                "average_message_length": total_chars // len(all_messages) if all_messages else 0
+                "average_message_length": total_chars // total_messages if total_messages else 0
             }
             
         except Exception as e:
@@ -1,24 +1,39 @@
-from datetime import datetime
-from pydantic import BaseModel, Field
-from typing import List, Literal, Optional, Dict
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import islice
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from typing import ClassVar, Deque, List, Literal, NamedTuple, Optional, Dict
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 # reasoning triplet 
 class ReasoningTriplet(BaseModel):
     """A data model for the question, reasoning chain, and answer triplet."""
+    model_config = ConfigDict(frozen=True)
+
     question: str = Field(description="The original question asked by the user.")
     reasoning_chain: str = Field(description="The step-by-step reasoning chain to arrive at the answer, based exclusively on the provided context.")
     answer: str = Field(description="The final, concise answer to the question, derived from the reasoning chain.")
 
 
 # Evaluation Models
+# Dimension weights, in MultidimensionalScores field order
+_SCORE_WEIGHTS = (0.30, 0.25, 0.15, 0.20, 0.10)
+
 class MultidimensionalScores(BaseModel):
     """
     Multidimensional scoring model for evaluating student answers across different criteria.
     
     Provides weighted scoring across five dimensions: conceptual accuracy, reasoning coherence,
     evidence utilization, conceptual integration, and clarity of expression.
+    Instances are frozen so derived scores can be computed once and cached.
     """
+    model_config = ConfigDict(frozen=True)
+
     conceptual_accuracy: float = Field(
         ge=0.0, le=1.0, 
         description="How well the student's answer uses the key concept correctly (30% weight)"
@@ -39,7 +54,7 @@ class MultidimensionalScores(BaseModel):
         ge=0.0, le=1.0,
         description="How clearly the student explains their reasoning and answer (10% weight)"
     )
-    @property
+    @cached_property
     def weighted_overall_score(self) -> float:
         """
         Calculate the weighted overall score using predefined weights.
@@ -47,15 +62,9 @@ class MultidimensionalScores(BaseModel):
         Returns:
             float: Weighted average score (0.0-1.0)
         """
-        return (
-            self.conceptual_accuracy * 0.30 +
-            self.reasoning_coherence * 0.25 +
-            self.use_of_evidence_and_rules * 0.15 +
-            self.conceptual_integration * 0.20 +
-            self.clarity_of_expression * 0.10
-        )
+        return sum(score * weight for score, weight in zip(self._dimension_scores(), _SCORE_WEIGHTS))
     
-    @property
+    @cached_property
     def multidimensional_average(self) -> float:
         """
         Calculate the unweighted average of all dimensional scores.
@@ -63,13 +72,18 @@ class MultidimensionalScores(BaseModel):
         Returns:
             float: Simple arithmetic average of all five dimensions (0.0-1.0)
         """
+        return sum(self._dimension_scores()) / 5
+
+    def _dimension_scores(self) -> tuple:
+        """Dimension scores in field order, matching _SCORE_WEIGHTS"""
         return (
-            self.conceptual_accuracy +
-            self.reasoning_coherence +
-            self.use_of_evidence_and_rules +
-            self.conceptual_integration +
+            self.conceptual_accuracy,
+            self.reasoning_coherence,
+            self.use_of_evidence_and_rules,
+            self.conceptual_integration,
             self.clarity_of_expression
-        ) / 5
+        )
+
     def get_weighted_breakdown(self) -> Dict[str, float]:
         """
         Get detailed breakdown of weighted scores for each dimension.
@@ -95,6 +109,18 @@ class EnhancedAnswerEvaluation(BaseModel):
     Combines binary evaluation with detailed multidimensional scores to provide
     nuanced assessment of student understanding and reasoning quality.
     """
+    model_config = ConfigDict(frozen=True)
+
+    # Numeric score for each binary evaluation category
+    _BINARY_MAP: ClassVar[Dict[str, float]] = {
+        "correct": 1.0,
+        "partially_correct": 0.7,
+        "incorrect_but_related": 0.4,
+        "incorrect": 0.1,
+        "unclear": 0.0,
+        "error": 0.0
+    }
+
     binary_evaluation: Literal[
         "correct",
         "partially_correct", 
@@ -116,7 +142,7 @@ class EnhancedAnswerEvaluation(BaseModel):
         default=None,
         description="Analysis of which parts of the expert reasoning the student demonstrated understanding of."
     )
-    @property
+    @cached_property
     def binary_score(self) -> float:
         """
         Convert binary evaluation to numeric score.
@@ -124,17 +150,9 @@ class EnhancedAnswerEvaluation(BaseModel):
         Returns:
             float: Numeric score (0.0-1.0) based on binary evaluation category
         """
-        binary_mapping ={
-            "correct":1.0,
-            "partially_correct":0.7,
-            "incorrect_but_related":0.4,
-            "incorrect":0.1,
-            "unclear":0.0,
-            "error":0.0
-        }
-        return binary_mapping.get(self.binary_evaluation, 0.0)
+        return self._BINARY_MAP.get(self.binary_evaluation, 0.0)
     
-    @property
+    @cached_property
     def overall_score(self) -> float:
         """
         Get the overall weighted multidimensional score.
@@ -151,16 +169,17 @@ class EnhancedAnswerEvaluation(BaseModel):
         Returns:
             Dict[str, float]: Dictionary with score categories and their values.
         """
+        scores = self.multidimensional_scores
         return {
             "binary_score": self.binary_score,
-            "multidimensional_average": self.multidimensional_scores.multidimensional_average,
+            "multidimensional_average": scores.multidimensional_average,
             "overall_score": self.overall_score,
             "dimensional_breakdown": {
-                "conceptual_accuracy": self.multidimensional_scores.conceptual_accuracy,
-                "reasoning_coherence": self.multidimensional_scores.reasoning_coherence,
-                "use_of_evidence_and_rules": self.multidimensional_scores.use_of_evidence_and_rules,
-                "conceptual_integration": self.multidimensional_scores.conceptual_integration,
-                "clarity_of_expression": self.multidimensional_scores.clarity_of_expression
+                "conceptual_accuracy": scores.conceptual_accuracy,
+                "reasoning_coherence": scores.reasoning_coherence,
+                "use_of_evidence_and_rules": scores.use_of_evidence_and_rules,
+                "conceptual_integration": scores.conceptual_integration,
+                "clarity_of_expression": scores.clarity_of_expression
             }
         }
 
@@ -176,6 +195,17 @@ class LearningLevel (str, Enum):
     L3_PROCEDURAL_FLUENCY = "L3_procedural_fluency"
     L4_CONCEPTUAL_TRANSFER = "L4_conceptual_transfer"
 
+# Level progression order and each level's neighbours
+_LEVEL_ORDER = (
+    LearningLevel.L0_PRE_CONCEPTUAL,
+    LearningLevel.L1_FAMILIARIZATION,
+    LearningLevel.L2_STRUCTURED_COMPREHENSION,
+    LearningLevel.L3_PROCEDURAL_FLUENCY,
+    LearningLevel.L4_CONCEPTUAL_TRANSFER
+)
+_NEXT_LEVEL_UP = dict(zip(_LEVEL_ORDER, _LEVEL_ORDER[1:] + (None,)))
+_NEXT_LEVEL_DOWN = dict(zip(_LEVEL_ORDER, (None,) + _LEVEL_ORDER[:-1]))
+
 class LevelAdjustment(BaseModel):
     """
     Records when and why a student's learning level was adjusted.
@@ -195,6 +225,40 @@ class LevelAdjustment(BaseModel):
         default_factory=datetime.now
         )
 
+# Number of recent evaluation scores kept for level decisions
+RECENT_SCORES_WINDOW = 5
+
+
+class _LevelUpRule(NamedTuple):
+    """Thresholds for advancing a level"""
+    min_evaluations: int  # Evaluations needed at the current level
+    window: int  # Most recent scores averaged (and needed) for the decision
+    high_streak: int  # Consecutive high scores that advance on their own
+    high_average: float  # Window average that advances together with...
+    high_average_streak: int  # ...this many consecutive high scores
+    sustained_average: float  # Window average that advances once...
+    sustained_scores: int  # ...this many scores have been recorded
+
+
+class _LevelDownRule(NamedTuple):
+    """Thresholds for moving down a level"""
+    min_evaluations: int  # Evaluations needed at the current level
+    window: int  # Most recent scores averaged (and needed) for the decision
+    low_streak: int  # Consecutive low scores that move down on their own
+    low_average: float  # Window average that moves down together with...
+    low_average_streak: int  # ...this many consecutive low scores
+
+
+_LEVEL_UP_RULE = _LevelUpRule(
+    min_evaluations=3, window=3, high_streak=3, high_average=0.80, high_average_streak=2,
+    sustained_average=0.85, sustained_scores=RECENT_SCORES_WINDOW
+)
+_LEVEL_DOWN_RULE = _LevelDownRule(
+    min_evaluations=4, window=4, low_streak=3, low_average=0.30, low_average_streak=4
+)
+# Score windows whose sums are cached for the level rules
+_SCORE_SUM_WINDOWS = tuple({_LEVEL_UP_RULE.window, _LEVEL_DOWN_RULE.window})
+
 class SessionLearningProfile(BaseModel):
     """
     Tracks student learning progression and performance throughout a session.
@@ -203,10 +267,18 @@ class SessionLearningProfile(BaseModel):
     maintains evaluation history, and provides insights for personalized tutoring.
     """
 
+    _LEVEL_DESCRIPTIONS: ClassVar[Dict[LearningLevel, str]] = {
+        LearningLevel.L0_PRE_CONCEPTUAL: "Building basic familiarity with concepts",
+        LearningLevel.L1_FAMILIARIZATION: "Developing initial understanding",
+        LearningLevel.L2_STRUCTURED_COMPREHENSION: "Organizing knowledge systematically",
+        LearningLevel.L3_PROCEDURAL_FLUENCY: "Applying knowledge confidently",
+        LearningLevel.L4_CONCEPTUAL_TRANSFER: "Mastering advanced applications"
+    }
+
     current_level: LearningLevel  = Field( default=LearningLevel.L2_STRUCTURED_COMPREHENSION)
 
-    recent_scores_history: List[float] = Field (
-        default_factory=list,
+    recent_scores_history: Deque[float] = Field (
+        default_factory=lambda: deque(maxlen=RECENT_SCORES_WINDOW),
         description = "List of recent evaluation overall scores, up to five scores."
     )
 
@@ -217,13 +289,44 @@ class SessionLearningProfile(BaseModel):
 
     # statistics
     total_interactions: int = Field(default=0)
-    session_start_time: datetime = Field(default_factory=datetime.now)
+    # Wall-clock start, materialized on first use by get_session_start_time()
+    session_start_time: Optional[datetime] = Field(default=None)
+
+    @field_validator("recent_scores_history", mode="after")
+    @classmethod
+    def _bound_scores_history(cls, value: Deque[float]) -> Deque[float]:
+        """Keep loaded histories bounded to the recent window"""
+        return deque(value, maxlen=RECENT_SCORES_WINDOW)
 
     # New fields for improved level management
     consecutive_high_performance: int = Field(default=0, description="Count of consecutive good performances")
     consecutive_low_performance: int = Field(default=0, description="Count of consecutive poor performances")
     level_stability_count: int = Field(default=0, description="How many evaluations at current level")
 
+    # Sums over the whole recent window and over the last scores of each level
+    # rule's window, refreshed whenever a score is added so rolling averages are a single divide
+    _recent_sum: float = PrivateAttr(default=0.0)
+    _window_sums: Dict[int, float] = PrivateAttr(default_factory=dict)
+    # Monotonic clock reading at session start, for elapsed-time math
+    _session_start_monotonic: float = PrivateAttr(default_factory=time.monotonic)
+
+    def model_post_init(self, __context) -> None:
+        self._refresh_score_sums()
+
+    def _refresh_score_sums(self) -> None:
+        """Recompute the cached window sums from the (at most 5) recent scores"""
+        history = self.recent_scores_history
+        size = len(history)
+        self._recent_sum = sum(history)
+        self._window_sums = {
+            window: sum(islice(history, max(0, size - window), None))
+            for window in _SCORE_SUM_WINDOWS
+        }
+
+    def _window_average(self, window: int) -> float:
+        """Average of the last `window` scores (or of all of them, if fewer)"""
+        return self._window_sums[window] / min(window, len(self.recent_scores_history))
+
     def add_evaluation_score(self,evaluation:EnhancedAnswerEvaluation) -> None:
         """
         Add new evaluation score and update learning profile metrics.
@@ -232,12 +335,10 @@ class SessionLearningProfile(BaseModel):
             evaluation: Enhanced evaluation containing multidimensional scores
         """
         score = evaluation.overall_score
-        self.recent_scores_history.append(score)
+        self.recent_scores_history.append(score)  # bounded deque drops the oldest score
+        self._refresh_score_sums()
         self.total_interactions += 1 
 
-        if len(self.recent_scores_history) > 5:
-            self.recent_scores_history.pop(0)
-
         self._update_performance_counters(score)
         self.level_stability_count += 1
         self.update_level(evaluation)
@@ -268,20 +369,7 @@ class SessionLearningProfile(BaseModel):
         Returns:
             bool: True if criteria for level advancement are met
         """
-        if self.current_level == LearningLevel.L4_CONCEPTUAL_TRANSFER:
-            return False
-        
-        if self.level_stability_count < 3:
-            return False
-        
-        if len(self.recent_scores_history) >= 3:
-            recent_avg = sum(self.recent_scores_history[-3:]) / 3
-            return (
-                self.consecutive_high_performance >= 3 or  # 3 consecutive high scores
-                (recent_avg >= 0.8 and self.consecutive_high_performance >= 2) or  # Very high average + 2 good
-                (recent_avg >= 0.85 and len(self.recent_scores_history) >= 5)  # Excellent sustained performance
-            )
-        return False
+        return self._evaluate_level_transition() > 0
     
     def should_level_down(self) -> bool:
         """
@@ -290,20 +378,42 @@ class SessionLearningProfile(BaseModel):
         Returns:
             bool: True if criteria for level reduction are met
         """
-        if self.current_level == LearningLevel.L0_PRE_CONCEPTUAL:
-            return False
-        
-        if self.level_stability_count < 4:
-            return False
+        return self._evaluate_level_transition() < 0
+    
+    def _evaluate_level_transition(self) -> int:
+        """
+        Decide the level change indicated by recent performance, driven by
+        the _LEVEL_UP_RULE / _LEVEL_DOWN_RULE thresholds.
         
-        if len(self.recent_scores_history) >= 4:
-            recent_avg = sum(self.recent_scores_history[-4:]) / 4
-            return (
-                self.consecutive_low_performance >= 3 or  # 3 consecutive low scores
-                (recent_avg <= 0.3 and self.consecutive_low_performance >= 4)  # Very low average + 4 bad
-               
-            )
-        return False
+        Returns:
+            int: 1 to level up, -1 to level down, 0 to stay at the current level
+        """
+        level = self.current_level
+        stability = self.level_stability_count
+        history_size = len(self.recent_scores_history)
+
+        rule = _LEVEL_UP_RULE
+        if level != LearningLevel.L4_CONCEPTUAL_TRANSFER and stability >= rule.min_evaluations and history_size >= rule.window:
+            recent_avg = self._window_average(rule.window)
+            high = self.consecutive_high_performance
+            if (
+                high >= rule.high_streak or  # Consecutive high scores
+                (recent_avg >= rule.high_average and high >= rule.high_average_streak) or  # Very high average + good streak
+                (recent_avg >= rule.sustained_average and history_size >= rule.sustained_scores)  # Excellent sustained performance
+            ):
+                return 1
+
+        rule = _LEVEL_DOWN_RULE
+        if level != LearningLevel.L0_PRE_CONCEPTUAL and stability >= rule.min_evaluations and history_size >= rule.window:
+            recent_avg = self._window_average(rule.window)
+            low = self.consecutive_low_performance
+            if (
+                low >= rule.low_streak or  # Consecutive low scores
+                (recent_avg <= rule.low_average and low >= rule.low_average_streak)  # Very low average + bad streak
+            ):
+                return -1
+
+        return 0
     
     def update_level(self, last_evaluation:EnhancedAnswerEvaluation) -> Optional[LevelAdjustment]:
         """
@@ -315,89 +425,60 @@ class SessionLearningProfile(BaseModel):
         Returns:
             Optional[LevelAdjustment]: Level change details if level changed
         """
-
-
         previous_level = self.current_level
         adjustment = None
 
-        if self.should_level_up():
+        direction = self._evaluate_level_transition()
+        if direction > 0:
             new_level = self._get_next_level_up()
-            if new_level:
-                reason = self._get_level_up_reason()
-                adjustment = LevelAdjustment(
-                    previous_level=previous_level,
-                    new_level=new_level,
-                    reason=reason,
-                    evaluation_score=last_evaluation.overall_score
-                )
-                self.current_level = new_level
-                self._reset_level_tracking()
-        elif self.should_level_down():
+        elif direction < 0:
             new_level = self._get_next_level_down()
-            if new_level:
-                reason = self._get_level_down_reason()
-                adjustment = LevelAdjustment(
-                    previous_level=previous_level,
-                    new_level=new_level,
-                    reason=reason,
-                    evaluation_score=last_evaluation.overall_score
-                )
-                self.current_level = new_level
-                self._reset_level_tracking()
+        else:
+            new_level = None
+
+        if new_level:
+            reason = self._get_level_up_reason() if direction > 0 else self._get_level_down_reason()
+            adjustment = LevelAdjustment(
+                previous_level=previous_level,
+                new_level=new_level,
+                reason=reason,
+                evaluation_score=last_evaluation.overall_score
+            )
+            self.current_level = new_level
+            self._reset_level_tracking()
 
         if adjustment:
             self.level_adjustments_history.append(adjustment)
-            print(f"[DEBUG] Level adjustment: {adjustment}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Level adjustment: %s", adjustment)
         
         return adjustment
 
     def _get_next_level_up(self) -> Optional[LearningLevel]:
         """Get the next level up from current level"""
-        level_progression = [
-            LearningLevel.L0_PRE_CONCEPTUAL,
-            LearningLevel.L1_FAMILIARIZATION,
-            LearningLevel.L2_STRUCTURED_COMPREHENSION,
-            LearningLevel.L3_PROCEDURAL_FLUENCY,
-            LearningLevel.L4_CONCEPTUAL_TRANSFER
-        ]
-        
-        current_index = level_progression.index(self.current_level)
-        if current_index < len(level_progression) - 1:
-            return level_progression[current_index + 1]
-        return None
+        return _NEXT_LEVEL_UP[self.current_level]
     
     def _get_next_level_down(self) -> Optional[LearningLevel]:
         """Get the next level down from current level"""
-        level_progression = [
-            LearningLevel.L0_PRE_CONCEPTUAL,
-            LearningLevel.L1_FAMILIARIZATION,
-            LearningLevel.L2_STRUCTURED_COMPREHENSION,
-            LearningLevel.L3_PROCEDURAL_FLUENCY,
-            LearningLevel.L4_CONCEPTUAL_TRANSFER
-        ]
-        
-        current_index = level_progression.index(self.current_level)
-        if current_index > 0:
-            return level_progression[current_index - 1]
-        return None
+        return _NEXT_LEVEL_DOWN[self.current_level]
     
     def _get_level_up_reason(self) -> str:
         """Get reason for level up based on performance pattern"""
-        if self.consecutive_high_performance >= 3:
+        if self.consecutive_high_performance >= _LEVEL_UP_RULE.high_streak:
             return f"Consistent excellence: {self.consecutive_high_performance} consecutive high scores"
         
-        recent_avg = sum(self.recent_scores_history[-3:]) / min(3, len(self.recent_scores_history))
-        if recent_avg >= 0.85:
+        recent_avg = self._window_average(_LEVEL_UP_RULE.window)
+        if recent_avg >= _LEVEL_UP_RULE.sustained_average:
             return f"Outstanding recent performance (avg: {recent_avg:.2f})"
         
         return f"Strong sustained performance (avg: {recent_avg:.2f})"
     
     def _get_level_down_reason(self) -> str:
         """Get reason for level down based on performance pattern"""
-        if self.consecutive_low_performance >= 4:
+        if self.consecutive_low_performance >= _LEVEL_DOWN_RULE.low_average_streak:
             return f"Needs additional support: {self.consecutive_low_performance} consecutive low scores"
         
-        recent_avg = sum(self.recent_scores_history[-4:]) / min(4, len(self.recent_scores_history))
+        recent_avg = self._window_average(_LEVEL_DOWN_RULE.window)
         return f"Requires foundational reinforcement (recent avg: {recent_avg:.2f})"
     
     def _reset_level_tracking(self) -> None:
@@ -413,14 +494,7 @@ class SessionLearningProfile(BaseModel):
         Returns:
             str: Descriptive text explaining the current learning level
         """
-        descriptions = {
-            LearningLevel.L0_PRE_CONCEPTUAL: "Building basic familiarity with concepts",
-            LearningLevel.L1_FAMILIARIZATION: "Developing initial understanding",
-            LearningLevel.L2_STRUCTURED_COMPREHENSION: "Organizing knowledge systematically",
-            LearningLevel.L3_PROCEDURAL_FLUENCY: "Applying knowledge confidently",
-            LearningLevel.L4_CONCEPTUAL_TRANSFER: "Mastering advanced applications"
-        }
-        return descriptions.get(self.current_level, "Developing understanding")
+        return self._LEVEL_DESCRIPTIONS.get(self.current_level, "Developing understanding")
     
     def get_performance_insights(self) -> Dict:
         """
@@ -430,58 +504,70 @@ class SessionLearningProfile(BaseModel):
             Dict: Comprehensive analytics including performance trends, level history,
                  and session statistics
         """
-        try:
-            insights = {
-                "current_level": self.current_level.value,
-                "level_description": self.get_level_description(),
-                "total_interactions": self.total_interactions,
-                "level_adjustments_count": len(self.level_adjustments_history),
-                "session_duration_minutes": self._calculate_session_duration(),
-            }
-            
-            # Performance metrics
-            if self.recent_scores_history:
-                insights.update({
-                    "recent_performance": {
-                        "average_score": round(sum(self.recent_scores_history) / len(self.recent_scores_history), 2),
-                        "latest_score": round(self.recent_scores_history[-1], 2),
-                        "score_trend": self._calculate_trend(),
-                        "scores_count": len(self.recent_scores_history)
-                    },
-                    "performance_streaks": {
-                        "consecutive_high": self.consecutive_high_performance,
-                        "consecutive_low": self.consecutive_low_performance,
-                        "stability_at_level": self.level_stability_count
-                    }
-                })
-            else:
-                insights["recent_performance"] = None
-                insights["performance_streaks"] = {
-                    "consecutive_high": 0,
-                    "consecutive_low": 0,
+        adjustments = self.level_adjustments_history
+        latest_adjustment = adjustments[-1] if adjustments else None
+        insights = {
+            "current_level": self.current_level.value,
+            "level_description": self.get_level_description(),
+            "total_interactions": self.total_interactions,
+            "level_adjustments_count": len(adjustments),
+            "session_duration_minutes": self._calculate_session_duration(),
+        }
+
+        # Performance metrics
+        if self.recent_scores_history:
+            insights.update({
+                "recent_performance": {
+                    "average_score": round(self._recent_sum / len(self.recent_scores_history), 2),
+                    "latest_score": round(self.recent_scores_history[-1], 2),
+                    "score_trend": self._calculate_trend(),
+                    "scores_count": len(self.recent_scores_history)
+                },
+                "performance_streaks": {
+                    "consecutive_high": self.consecutive_high_performance,
+                    "consecutive_low": self.consecutive_low_performance,
                     "stability_at_level": self.level_stability_count
                 }
-            
-            # Level progression insights
-            if self.level_adjustments_history:
-                latest_adjustment = self.level_adjustments_history[-1]
-                insights["level_progression"] = {
-                    "last_change": {
-                        "from": latest_adjustment.previous_level.value,
-                        "to": latest_adjustment.new_level.value,
-                        "reason": latest_adjustment.reason,
-                        "score": round(latest_adjustment.evaluation_score, 2)
-                    },
-                    "total_changes": len(self.level_adjustments_history)
-                }
-            else:
-                insights["level_progression"] = None
-                
-            return insights
-            
-        except Exception as e:
-            return {"error": f"Could not generate insights: {str(e)}"}  
-           
+            })
+        else:
+            insights["recent_performance"] = None
+            insights["performance_streaks"] = {
+                "consecutive_high": 0,
+                "consecutive_low": 0,
+                "stability_at_level": self.level_stability_count
+            }
+
+        # Level progression insights
+        if latest_adjustment is not None:
+            insights["level_progression"] = {
+                "last_change": {
+                    "from": latest_adjustment.previous_level.value,
+                    "to": latest_adjustment.new_level.value,
+                    "reason": latest_adjustment.reason,
+                    "score": round(latest_adjustment.evaluation_score, 2)
+                },
+                "total_changes": len(adjustments)
+            }
+        else:
+            insights["level_progression"] = None
+
+        return insights
+
+    def get_session_start_time(self) -> datetime:
+        """
+        Get the wall-clock time the session started.
+        
+        Derived from the monotonic start reading on first call, so creating
+        a profile does not need to read the wall clock.
+        
+        Returns:
+            datetime: Session start time
+        """
+        if self.session_start_time is None:
+            elapsed = time.monotonic() - self._session_start_monotonic
+            self.session_start_time = datetime.now() - timedelta(seconds=elapsed)
+        return self.session_start_time
+
     def _calculate_session_duration(self) -> float:
         """
         Calculate total session duration in minutes.
@@ -489,11 +575,7 @@ class SessionLearningProfile(BaseModel):
         Returns:
             float: Session duration in minutes, rounded to 1 decimal place
         """
-        try:
-            duration = (datetime.now() - self.session_start_time).total_seconds() / 60
-            return round(duration, 1)
-        except:
-            return 0.0
+        return round((time.monotonic() - self._session_start_monotonic) / 60, 1)
     
     def _calculate_trend(self) -> str:
         """
@@ -502,17 +584,22 @@ class SessionLearningProfile(BaseModel):
         Returns:
             str: Performance trend ("improving", "declining", "stable", or "insufficient_data")
         """
-        if len(self.recent_scores_history) < 2:
+        history = self.recent_scores_history
+        size = len(history)
+        if size < 2:
             return "insufficient_data"
         
-        recent_half = self.recent_scores_history[len(self.recent_scores_history)//2:]
-        earlier_half = self.recent_scores_history[:len(self.recent_scores_history)//2]
-        
-        if not earlier_half:
-            return "insufficient_data"
+        # Sum both halves in one pass over the window
+        half = size // 2
+        earlier_sum = recent_sum = 0.0
+        for i, score in enumerate(history):
+            if i < half:
+                earlier_sum += score
+            else:
+                recent_sum += score
         
-        recent_avg = sum(recent_half) / len(recent_half)
-        earlier_avg = sum(earlier_half) / len(earlier_half)
+        recent_avg = recent_sum / (size - half)
+        earlier_avg = earlier_sum / half
         
         diff = recent_avg - earlier_avg
         
@@ -1,13 +1,14 @@
 import os
 import asyncio
 from dotenv import load_dotenv
-import glob
+import hashlib
+import json
 import shutil
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
-from llama_cloud_services import LlamaParse
-from llama_index.core.indices import MultiModalVectorStoreIndex
-from llama_index.embeddings.voyageai import VoyageEmbedding
-from sqlalchemy import true
 from . import config
 
 load_dotenv()
@@ -17,10 +18,170 @@ PERSISTENCE_DIR = config.PERSISTENCE_DIR
 DATA_DOCUMENTS_DIR = config.DATA_DOCUMENTS_DIR
 DATA_IMAGES_DIR = config.DATA_IMAGES_DIR
 
+@dataclass(frozen=True, slots=True)
+class IndexConfig:
+    """
+    Settings for building indexes, resolved once when the module is imported.
+    """
+    llama_cloud_api_key: Optional[str]
+    voyage_api_key: Optional[str]
+    persist_dir: str
+    documents_dir: str
+
+INDEX_CONFIG = IndexConfig(
+    llama_cloud_api_key=os.getenv("LLAMA_CLOUD_API_KEY"),
+    voyage_api_key=os.getenv("VOYAGE_API_KEY"),
+    persist_dir=PERSISTENCE_DIR,
+    documents_dir=DATA_DOCUMENTS_DIR,
+)
+
+# Maximum LlamaParse result post-processing calls in flight at once
+PARSE_RESULT_CONCURRENCY = 8
+
+# Nodes sent per Voyage embedding request. Split-by-page markdown nodes stay
+# well within the per-request token limit at this size, while the library
+# default (10) needs several times as many round-trips
+EMBED_BATCH_SIZE = 64
+# Image nodes sent per Voyage embedding request. Voyage also caps the total
+# pixels per multimodal request (16M), and full-page screenshots are a few
+# megapixels each, so images are sent in much smaller batches than text
+IMAGE_EMBED_BATCH_SIZE = 4
+
+# Minimum documents indexed between checkpoints of a partially built index. Each
+# checkpoint rewrites the whole index, so the interval also grows with the index
+# (to half the documents already checkpointed) to keep the total cost linear
+CHECKPOINT_INTERVAL = 10
+# Sidecar in the index directory listing documents already in a partial build
+CHECKPOINT_FILE = ".processed"
+
+@lru_cache(maxsize=1)
+def _get_parser(api_key: str):
+    """
+    Get the LlamaParse client, created once and shared by every index build.
+    
+    Args:
+        api_key: LlamaCloud API key
+        
+    Returns:
+        LlamaParse: Parser configured for markdown output with page screenshots
+    """
+    # Indexing-only dependency, imported here so that serving queries against
+    # a persisted index does not pay for loading it
+    from llama_cloud_services import LlamaParse
+
+    return LlamaParse(
+        api_key=api_key,
+        result_type="markdown",
+        take_screenshot=True,
+        show_progress=True,
+        auto_mode=True,
+    )
+
+@lru_cache(maxsize=2)
+def _get_embed_model(api_key: str, embed_batch_size: int = EMBED_BATCH_SIZE):
+    """
+    Get the Voyage multimodal embedding model, created once per batch size and
+    shared by every index build.
+    
+    Args:
+        api_key: Voyage AI API key
+        embed_batch_size: Nodes sent per embedding request
+        
+    Returns:
+        VoyageEmbedding: Embedding model for text nodes, or for image nodes
+        when created with IMAGE_EMBED_BATCH_SIZE
+    """
+    from llama_index.embeddings.voyageai import VoyageEmbedding
+
+    return VoyageEmbedding(
+        model_name="voyage-multimodal-3",
+        voyage_api_key=api_key,
+        truncation=True,
+        embed_batch_size=embed_batch_size
+    )
+
+def _list_pdf_files(directory: str) -> list:
+    """
+    List the PDF files directly inside a directory.
+    
+    Uses os.scandir so the file-type check is served from the directory
+    listing instead of a stat per entry. Matches the "*.pdf" glob it
+    replaces: case-sensitive suffix, hidden files skipped.
+    
+    Args:
+        directory: Directory to scan
+        
+    Returns:
+        list: Paths of the PDF files, empty if the directory does not exist
+    """
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith(".pdf") and not entry.name.startswith(".") and entry.is_file()
+        ]
+
+def _document_key(file_path: str) -> str:
+    """
+    Identify a document version by its absolute path and modification time.
+    
+    Args:
+        file_path: Path to the document
+        
+    Returns:
+        str: SHA-256 hex digest of the path and mtime
+    """
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    return hashlib.sha256(f"{os.path.abspath(file_path)}:{mtime_ns}".encode("utf-8")).hexdigest()
+
+def _load_checkpoint(persist_dir: str) -> set:
+    """
+    Read the documents recorded by the last checkpoint of an interrupted build.
+    
+    Args:
+        persist_dir: Index directory
+        
+    Returns:
+        set: Keys of documents already in the persisted index, empty if the
+             directory holds no partial build
+    """
+    try:
+        with open(os.path.join(persist_dir, CHECKPOINT_FILE), encoding="utf-8") as f:
+            return set(json.load(f))
+    except FileNotFoundError:
+        return set()
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable index checkpoint in {persist_dir}: {e}")
+        return set()
+
+def _save_checkpoint(index, persist_dir: str, processed_keys: set):
+    """
+    Persist the partially built index and record which documents it contains.
+    
+    The sidecar is replaced atomically after the index is written, so it never
+    lists a document whose nodes are not on disk.
+    
+    Args:
+        index: Index being built
+        persist_dir: Index directory
+        processed_keys: Keys of documents whose nodes are in the index
+    """
+    index.storage_context.persist(persist_dir=persist_dir)
+    checkpoint_path = os.path.join(persist_dir, CHECKPOINT_FILE)
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(sorted(processed_keys), f)
+    os.replace(tmp_path, checkpoint_path)
+
 async def create_index_from_files(file_paths: list = None, output_dir: str = None):
     """
     Creates and persists the vector store index from specified files.
     
+    The index is checkpointed every CHECKPOINT_INTERVAL documents. If the output
+    directory holds an interrupted build of a subset of the same (unchanged)
+    documents, the documents already in it are skipped; otherwise it is rebuilt.
+    
     Args:
         file_paths: List of PDF file paths to process. If None, uses default documents directory.
         output_dir: Directory to save the index. If None, uses default persistence directory.
@@ -31,77 +192,185 @@ async def create_index_from_files(file_paths: list = None, output_dir: str = Non
     Raises:
         ValueError: If no PDF files are provided or found
     """
+    # Indexing-only dependency, imported here so that serving queries against
+    # a persisted index does not pay for loading it
+    from llama_index.core.indices import MultiModalVectorStoreIndex
+
     print("Creating new index...")
     
     if file_paths is None:
         # Default behavior: scan documents directory
-        file_paths = glob.glob(os.path.join(DATA_DOCUMENTS_DIR, "*.pdf"))
+        file_paths = _list_pdf_files(INDEX_CONFIG.documents_dir)
     
     if not file_paths:
         raise ValueError("No PDF files provided or found")
     
-    # Set output directory
-    persist_dir = output_dir or PERSISTENCE_DIR
+    # Set output directory (normalized so a trailing separator cannot place the
+    # moved-aside copy of an old index inside the directory being replaced)
+    persist_dir = os.path.normpath(output_dir or INDEX_CONFIG.persist_dir)
     
-    # Clean existing index if it exists
-    if os.path.exists(persist_dir):
-        shutil.rmtree(persist_dir)
-    os.makedirs(persist_dir, exist_ok=True)
+    # embedding models (same model, smaller requests for images)
+    embed_model = _get_embed_model(INDEX_CONFIG.voyage_api_key)
+    image_embed_model = _get_embed_model(INDEX_CONFIG.voyage_api_key, IMAGE_EMBED_BATCH_SIZE)
+
+    document_keys = {file_path: _document_key(file_path) for file_path in file_paths}
+    processed_keys = _load_checkpoint(persist_dir)
+    if processed_keys and not processed_keys <= set(document_keys.values()):
+        # The partial build holds documents that were since removed or modified;
+        # resuming would keep their stale nodes, so start over instead
+        print(f"Discarding interrupted index build in {persist_dir}: its documents have changed")
+        processed_keys = set()
+    stale_index_cleanup = None
+    try:
+        if processed_keys:
+            # An earlier build of this index was interrupted: continue from its
+            # last checkpoint instead of parsing every document again
+            from llama_index.core import StorageContext, load_index_from_storage
+
+            print(f"Resuming index build in {persist_dir} ({len(processed_keys)} documents already indexed)")
+            index = load_index_from_storage(
+                StorageContext.from_defaults(persist_dir=persist_dir),
+                embed_model=embed_model,
+                image_embed_model=image_embed_model
+            )
+        else:
+            # Clean existing index if it exists: move it aside with a single rename and
+            # delete it in the background while the new index is being built
+            if os.path.exists(persist_dir):
+                stale_dir = f"{persist_dir}.old.{os.getpid()}.{time.time_ns()}"
+                os.rename(persist_dir, stale_dir)
+                stale_index_cleanup = asyncio.create_task(
+                    asyncio.to_thread(shutil.rmtree, stale_dir)
+                )
+            os.makedirs(persist_dir, exist_ok=True)
+
+            # vector store index, filled document by document below so that only the
+            # nodes of the documents currently being processed are held in memory
+            index = MultiModalVectorStoreIndex(
+                nodes=[],
+                embed_model=embed_model,
+                image_embed_model=image_embed_model,
+                show_progress=True
+            )
     
-    # Also create images directory for this index
-    images_dir = os.path.join(persist_dir, "images")
-    os.makedirs(images_dir, exist_ok=True)
+        # Also create images directory for this index
+        images_dir = os.path.join(persist_dir, "images")
+        os.makedirs(images_dir, exist_ok=True)
     
-    print(f"Processing {len(file_paths)} PDF files...")
-    print(f"Files: {[os.path.basename(f) for f in file_paths]}")
+        pending_paths = [path for path in file_paths if document_keys[path] not in processed_keys]
     
-    parser = LlamaParse(
-        api_key=os.getenv("LLAMA_CLOUD_API_KEY"),
-        result_type="markdown",
-        take_screenshot=True,
-        show_progress=True,
-        auto_mode=True,
-    )
+        print(f"Processing {len(pending_paths)} PDF files...")
+        print(f"Files: {[os.path.basename(f) for f in pending_paths]}")
     
-    result = await parser.aparse(file_path=file_paths)
+        parser = _get_parser(INDEX_CONFIG.llama_cloud_api_key)
 
-    all_markdown_nodes = []
-    all_image_nodes = []
-    
-    for result_item in result:
-        markdown_nodes = await result_item.aget_markdown_nodes(
-            split_by_page=True,
-        )
-        image_nodes = await result_item.aget_image_nodes(
-            include_screenshot_images=True,
-            include_object_images=False,
-            image_download_dir=images_dir  # Use index-specific images directory
-        )
-        all_markdown_nodes.extend(markdown_nodes)
-        all_image_nodes.extend(image_nodes)
+        # Parsing, node extraction, image downloads and embedding are independent
+        # per document, so run them concurrently (bounded to stay within API rate limits)
+        semaphore = asyncio.Semaphore(PARSE_RESULT_CONCURRENCY)
+        # A checkpoint must not persist the index while an insert is half-applied,
+        # so inserts and checkpoints are coordinated through this condition:
+        # checkpoints wait for running inserts to finish, and new inserts wait
+        # while a checkpoint is pending
+        index_idle = asyncio.Condition()
+        checkpoint_lock = asyncio.Lock()
+        inserts_in_progress = 0
+        checkpoint_pending = False
+        documents_since_checkpoint = 0
+        # Save running in a worker thread; cancelling its awaiting task does not
+        # stop the thread, so a failed build waits for it before returning
+        checkpoint_save = None
 
-    all_nodes = [*all_markdown_nodes, *all_image_nodes]
-    print(f"LlamaParse completed. Found {len(all_markdown_nodes)} text nodes and {len(all_image_nodes)} image nodes in total.")
-    
-    # embedding model
-    embed_model = VoyageEmbedding(
-        model_name="voyage-multimodal-3",
-        voyage_api_key=os.getenv("VOYAGE_API_KEY"),
-        truncation=True
-    )
+        def checkpoint_due():
+            return documents_since_checkpoint >= max(CHECKPOINT_INTERVAL, len(processed_keys) // 2)
 
-    # vector store index
-    index = MultiModalVectorStoreIndex(
-        nodes=all_nodes,
-        embed_model=embed_model,
-        image_embed_model=embed_model,
-        show_progress=True
-    )
+        async def checkpoint():
+            nonlocal checkpoint_pending, documents_since_checkpoint, checkpoint_save
+            async with checkpoint_lock:
+                # Another document may have taken the checkpoint while this one waited
+                if not checkpoint_due():
+                    return
+                async with index_idle:
+                    checkpoint_pending = True
+                    try:
+                        await index_idle.wait_for(lambda: inserts_in_progress == 0)
+                        documents_since_checkpoint = 0
+                        checkpoint_save = asyncio.ensure_future(
+                            asyncio.to_thread(_save_checkpoint, index, persist_dir, set(processed_keys))
+                        )
+                        await asyncio.shield(checkpoint_save)
+                    finally:
+                        checkpoint_pending = False
+                        index_idle.notify_all()
 
-    # persistence context
-    print(f"Saving index to {persist_dir}")
-    index.storage_context.persist(persist_dir=persist_dir)
-    print("Index created and saved.")
+        async def index_document(file_path):
+            nonlocal inserts_in_progress, documents_since_checkpoint
+            async with semaphore:
+                result_item = await parser.aparse(file_path=file_path)
+                markdown_nodes, image_nodes = await asyncio.gather(
+                    result_item.aget_markdown_nodes(
+                        split_by_page=True,
+                    ),
+                    result_item.aget_image_nodes(
+                        include_screenshot_images=True,
+                        include_object_images=False,
+                        image_download_dir=images_dir  # Use index-specific images directory
+                    ),
+                )
+                async with index_idle:
+                    await index_idle.wait_for(lambda: not checkpoint_pending)
+                    inserts_in_progress += 1
+                inserted = False
+                try:
+                    await index.ainsert_nodes([*markdown_nodes, *image_nodes])
+                    inserted = True
+                finally:
+                    async with index_idle:
+                        inserts_in_progress -= 1
+                        if inserted:
+                            processed_keys.add(document_keys[file_path])
+                            documents_since_checkpoint += 1
+                        index_idle.notify_all()
+
+            # Checkpoint periodically so a failed parse later in the batch only
+            # loses the documents indexed since the last checkpoint
+            if checkpoint_due():
+                await checkpoint()
+            return len(markdown_nodes), len(image_nodes)
+
+        tasks = [asyncio.create_task(index_document(file_path)) for file_path in pending_paths]
+        try:
+            node_counts = await asyncio.gather(*tasks)
+        except BaseException:
+            # One document failed: stop the others instead of leaving them running
+            # against an index that is about to be abandoned
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Do not return while a checkpoint is still being written: a retry
+            # would load a half-written index
+            if checkpoint_save is not None:
+                await asyncio.gather(checkpoint_save, return_exceptions=True)
+            raise
+        text_node_count = sum(text_count for text_count, _ in node_counts)
+        image_node_count = sum(image_count for _, image_count in node_counts)
+        print(f"LlamaParse completed. Found {text_node_count} text nodes and {image_node_count} image nodes in total.")
+
+        # persistence context
+        print(f"Saving index to {persist_dir}")
+        await asyncio.to_thread(index.storage_context.persist, persist_dir=persist_dir)
+        # The index is complete, so it must not be resumed by the next build
+        checkpoint_path = os.path.join(persist_dir, CHECKPOINT_FILE)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        print("Index created and saved.")
+    finally:
+        # Wait for the old index to be removed even when the build fails, so
+        # the deletion is not abandoned and its errors are reported
+        if stale_index_cleanup is not None:
+            try:
+                await stale_index_cleanup
+            except OSError as e:
+                print(f"Could not remove previous index {stale_dir}: {e}")
     
     return persist_dir
 
@@ -9,10 +9,46 @@ Additional features for production deployment:
 - Enhanced logging
 """
 
+import atexit
+import os
+import threading
 import time
 import re
-from typing import Dict, List
-from datetime import datetime, timedelta
+from collections import defaultdict, deque
+from itertools import islice
+from typing import DefaultDict, Deque, Dict, List, NamedTuple, Optional, Tuple
+from datetime import datetime
+
+# Seconds between rate limiter sweeps that forget users with no recent requests
+RATE_LIMIT_SWEEP_INTERVAL = 300
+# Users checked per rate limiter call while a sweep is in progress
+RATE_LIMIT_SWEEP_BATCH = 64
+# Interaction records kept by ConversationMetrics for analysis
+METRICS_HISTORY_SIZE = 10_000
+# Interactions averaged for the avg_response_length metric
+METRICS_RECENT_RESPONSES = 10
+# Seconds covered by the interactions_last_hour metric
+METRICS_RECENT_WINDOW = 3600
+# Interactions kept by ProductionTutorEngine for conversation context
+CONVERSATION_HISTORY_SIZE = 10
+# Interaction log entries held in memory before the oldest are dropped
+LOG_BUFFER_SIZE = 8192
+# Seconds between background writes of buffered interaction log entries
+LOG_FLUSH_INTERVAL = 0.5
+# Interaction log size that triggers a rollover, and rolled-over files kept
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 5
+# Within a streak of failed log writes, only every Nth failure is reported
+LOG_ERROR_REPORT_EVERY = 100
+# %.100s truncates question and response while formatting, without slicing copies
+_LOG_ENTRY_FORMAT = "[%s] User: %s | Q: %.100s... | R: %.100s...\n"
+# Splits text into the same words a \b...\b pattern would match
+_NON_WORD_PATTERN = re.compile(r"\W+")
+# Maps every ASCII non-word character to a space, so ASCII text can be split
+# into the same words with str.split() and no regex
+_ASCII_NON_WORD_TABLE = str.maketrans({
+    c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")
+})
 
 class ProductionEnhancements:
     def __init__(self, knowledge_base_index=None):
@@ -26,11 +62,11 @@ class ProductionEnhancements:
         self.metrics = ConversationMetrics()
         self.logger = EnhancedLogger()
         
-        # Minimal harmful content patterns (optional safety check)
-        self.harmful_patterns = [
-            r'\b(hate|violence|illegal|harmful)\b',
-            r'\b(offensive|inappropriate|adult)\b'
-        ]
+        # Minimal harmful content words (optional safety check), matched as whole words
+        self.harmful_words = frozenset({
+            "hate", "violence", "illegal", "harmful",
+            "offensive", "inappropriate", "adult"
+        })
     
     def is_request_allowed(self, user_id: str = "default") -> bool:
         """
@@ -46,7 +82,7 @@ class ProductionEnhancements:
     
     def contains_harmful_content(self, question: str) -> bool:
         """
-        Basic safety check for obviously harmful content using pattern matching.
+        Basic safety check for obviously harmful content using whole-word lookup.
         
         Args:
             question: User's question to check for harmful content
@@ -54,13 +90,15 @@ class ProductionEnhancements:
         Returns:
             bool: True if harmful content detected, False otherwise
         """
-        question_lower = question.lower().strip()
-        for pattern in self.harmful_patterns:
-            if re.search(pattern, question_lower):
-                return True
-        return False
+        question_lower = question.lower()
+        if question_lower.isascii():
+            words = question_lower.translate(_ASCII_NON_WORD_TABLE).split()
+        else:
+            words = _NON_WORD_PATTERN.split(question_lower)
+        return not self.harmful_words.isdisjoint(words)
     
-    def log_interaction(self, question: str, response: str, user_id: str = "default"):
+    def log_interaction(self, question: str, response: str, user_id: str = "default",
+                        timestamp_ns: Optional[int] = None):
         """
         Log user interaction for analysis and record conversation metrics.
         
@@ -68,11 +106,17 @@ class ProductionEnhancements:
             question: User's question
             response: System's response
             user_id: User identifier for logging
+            timestamp_ns: Wall-clock time of the interaction from time.time_ns(),
+                shared by the log entry and the metrics record. Defaults to now.
         """
-        self.logger.log_interaction(question, response, user_id)
-        self.metrics.record_interaction(question, response)
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        self.logger.log_interaction(question, response, user_id, timestamp_ns)
+        self.metrics.record_interaction(question, response, timestamp_ns)
 
 class RateLimiter:
+    __slots__ = ("max_requests", "time_window", "request_log", "_last_sweep", "_sweep_pending")
+    
     def __init__(self, max_requests: int = 10, time_window: int = 60):
         """
         Initialize rate limiter with configurable limits.
@@ -83,7 +127,10 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window  # seconds
-        self.request_log: Dict[str, List[datetime]] = {}
+        self.request_log: DefaultDict[str, Deque[float]] = defaultdict(deque)
+        self._last_sweep = time.monotonic()
+        # Users still to be checked by the sweep in progress
+        self._sweep_pending: List[str] = []
     
     def is_allowed(self, user_id: str) -> bool:
         """
@@ -95,59 +142,111 @@ class RateLimiter:
         Returns:
             bool: True if request is allowed, False if rate limited
         """
-        now = datetime.now()
+        now = time.monotonic()
+        cutoff_time = now - self.time_window
         
-        if user_id not in self.request_log:
-            self.request_log[user_id] = []
+        if self._sweep_pending:
+            self._sweep_idle_users(cutoff_time)
+        elif now - self._last_sweep >= RATE_LIMIT_SWEEP_INTERVAL:
+            self._last_sweep = now
+            self._sweep_pending = list(self.request_log)
+            self._sweep_idle_users(cutoff_time)
         
-        # Clean old requests
-        cutoff_time = now - timedelta(seconds=self.time_window)
-        self.request_log[user_id] = [
-            req_time for req_time in self.request_log[user_id] 
-            if req_time > cutoff_time
-        ]
+        user_log = self.request_log[user_id]
+        
+        # Clean old requests (timestamps are appended in order)
+        while user_log and user_log[0] <= cutoff_time:
+            user_log.popleft()
         
         # Check if under limit
-        if len(self.request_log[user_id]) < self.max_requests:
-            self.request_log[user_id].append(now)
+        if len(user_log) < self.max_requests:
+            user_log.append(now)
             return True
         
         return False
+    
+    def _sweep_idle_users(self, cutoff_time: float):
+        """
+        Forget users whose requests have all left the time window.
+        
+        Checks at most RATE_LIMIT_SWEEP_BATCH pending users, so a sweep over
+        many users is spread across calls instead of stalling one request.
+        
+        Args:
+            cutoff_time: Monotonic time before which requests no longer count
+        """
+        pending = self._sweep_pending
+        request_log = self.request_log
+        for _ in range(min(RATE_LIMIT_SWEEP_BATCH, len(pending))):
+            user_id = pending.pop()
+            user_log = request_log.get(user_id)
+            if user_log is not None and (not user_log or user_log[-1] <= cutoff_time):
+                del request_log[user_id]
+
+class Interaction(NamedTuple):
+    """
+    Metrics record for a single user-tutor interaction.
+    """
+    timestamp_ns: int
+    question_length: int
+    response_length: int
+    question: Optional[str]  # First 100 chars, kept only when previews are enabled
 
 class ConversationMetrics:
-    def __init__(self):
+    def __init__(self, store_question_previews: bool = False):
         """
         Initialize conversation metrics tracking.
         
         Sets up counters and storage for interaction analytics.
+        
+        Args:
+            store_question_previews: Keep the first 100 chars of each question
+                in the interaction records for analysis
         """
-        self.interactions = []
+        self.store_question_previews = store_question_previews
+        self.interactions: Deque[Interaction] = deque(maxlen=METRICS_HISTORY_SIZE)
         self.conversation_starts = 0
         self.total_questions = 0
         self.avg_question_length = 0
         self.topic_switches = 0
+        self._total_question_length = 0
+        # Response lengths of the last METRICS_RECENT_RESPONSES interactions and their sum
+        self._recent_response_lengths: Deque[int] = deque(maxlen=METRICS_RECENT_RESPONSES)
+        self._recent_response_total = 0
+        # Monotonic times (ns) of the interactions inside METRICS_RECENT_WINDOW
+        self._recent_window: Deque[int] = deque()
     
-    def record_interaction(self, question: str, response: str):
+    def record_interaction(self, question: str, response: str, timestamp_ns: Optional[int] = None):
         """
         Record metrics for each user-tutor interaction.
         
         Args:
             question: User's question text
             response: System's response text
+            timestamp_ns: Wall-clock time of the interaction from time.time_ns(). Defaults to now.
         """
+        question_length = len(question)
+        response_length = len(response)
         self.total_questions += 1
-        self.interactions.append({
-            'timestamp': datetime.now(),
-            'question_length': len(question),
-            'response_length': len(response),
-            'question': question[:100]  # Store first 100 chars for analysis
-        })
+        self.interactions.append(Interaction(
+            time.time_ns() if timestamp_ns is None else timestamp_ns,
+            question_length,
+            response_length,
+            question[:100] if self.store_question_previews else None
+        ))
+        
+        now = time.monotonic_ns()
+        self._recent_window.append(now)
+        self._expire_recent_window(now)
         
         # Update running averages
-        self.avg_question_length = (
-            (self.avg_question_length * (self.total_questions - 1) + len(question)) 
-            / self.total_questions
-        )
+        recent_lengths = self._recent_response_lengths
+        if len(recent_lengths) == recent_lengths.maxlen:
+            self._recent_response_total -= recent_lengths[0]
+        recent_lengths.append(response_length)
+        self._recent_response_total += response_length
+        self._total_question_length += question_length
+        self.avg_question_length = self._total_question_length / self.total_questions
     
     def get_summary(self) -> Dict:
         """
@@ -159,18 +258,173 @@ class ConversationMetrics:
         if not self.interactions:
             return {"status": "No interactions recorded"}
         
-        recent_interactions = self.interactions[-10:]  # Last 10 interactions
-        avg_response_length = sum(i['response_length'] for i in recent_interactions) / len(recent_interactions)
+        avg_response_length = self._recent_response_total / len(self._recent_response_lengths)
+        self._expire_recent_window(time.monotonic_ns())
         
         return {
             'total_questions': self.total_questions,
             'avg_question_length': round(self.avg_question_length, 1),
             'avg_response_length': round(avg_response_length, 1),
-            'interactions_last_hour': len([
-                i for i in self.interactions 
-                if i['timestamp'] > datetime.now() - timedelta(hours=1)
-            ])
+            'interactions_last_hour': len(self._recent_window)
         }
+    
+    def _expire_recent_window(self, now: int):
+        """
+        Drop interactions older than METRICS_RECENT_WINDOW from the recent window.
+        
+        Args:
+            now: Current monotonic time in nanoseconds
+        """
+        cutoff_time = now - METRICS_RECENT_WINDOW * 1_000_000_000
+        recent_window = self._recent_window
+        while recent_window and recent_window[0] <= cutoff_time:
+            recent_window.popleft()
+
+class _InteractionLogWriter:
+    """
+    Buffered writer for one log file, shared by every EnhancedLogger logging to
+    it so that a single background thread writes and rotates the file.
+    """
+    def __init__(self, log_file: str):
+        self.log_file = log_file
+        # (unix time in ns, user_id, question, response), formatted by the flusher
+        self._buffer: Deque[Tuple[int, str, str, str]] = deque(maxlen=LOG_BUFFER_SIZE)
+        self._file = None
+        self._flush_lock = threading.Lock()
+        self._failed_writes = 0  # Consecutive failed flushes
+        self._loggers = 0  # EnhancedLogger instances using this writer, guarded by _LOG_WRITERS_LOCK
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="interaction-log-flusher",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def append(self, entry: Tuple[int, str, str, str]):
+        """Queue an entry for the next flush"""
+        self._buffer.append(entry)
+    
+    def flush(self):
+        """
+        Write all buffered log entries to the log file in a single call.
+        """
+        with self._flush_lock:
+            batch = []
+            try:
+                while True:
+                    batch.append(self._buffer.popleft())
+            except IndexError:
+                pass
+            if not batch:
+                return
+            
+            try:
+                if self._file is None:
+                    self._file = open(self.log_file, "a", encoding="utf-8")
+                self._file.write("".join(
+                    _LOG_ENTRY_FORMAT % (datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(), user_id, question, response)
+                    for timestamp_ns, user_id, question, response in batch
+                ))
+                self._file.flush()
+                if os.fstat(self._file.fileno()).st_size >= LOG_MAX_BYTES:
+                    self._rollover()
+            except Exception as e:
+                # Report the first failure of a streak and then only every
+                # LOG_ERROR_REPORT_EVERY-th, so a full disk does not flood stderr
+                self._failed_writes += 1
+                if self._failed_writes % LOG_ERROR_REPORT_EVERY == 1:
+                    print(f"Logging error ({self._failed_writes} failed writes): {e}")
+            else:
+                if self._failed_writes:
+                    print(f"Logging recovered after {self._failed_writes} failed writes")
+                    self._failed_writes = 0
+    
+    def _rollover(self):
+        """
+        Rotate the log file like logging.handlers.RotatingFileHandler:
+        tutor_interactions.log becomes .1, .1 becomes .2, and so on up to
+        LOG_BACKUP_COUNT. Caller must hold the flush lock.
+        """
+        self._file.close()
+        self._file = None  # Reopened on the next flush
+        for index in range(LOG_BACKUP_COUNT - 1, 0, -1):
+            source = f"{self.log_file}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.log_file}.{index + 1}")
+        os.replace(self.log_file, f"{self.log_file}.1")
+    
+    def close(self):
+        """
+        Stop the background thread, flush pending entries and close the log file.
+        """
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+        with self._flush_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def _flush_periodically(self):
+        """
+        Background loop that flushes the buffer every LOG_FLUSH_INTERVAL seconds.
+        """
+        while not self._closed.wait(LOG_FLUSH_INTERVAL):
+            self.flush()
+
+
+# Open log writers by absolute file path
+_LOG_WRITERS: Dict[str, _InteractionLogWriter] = {}
+_LOG_WRITERS_LOCK = threading.Lock()
+
+
+def _acquire_log_writer(log_file: str) -> _InteractionLogWriter:
+    """
+    Get the writer for a log file, starting it if no logger is using it yet.
+    
+    Args:
+        log_file: Path of the log file
+        
+    Returns:
+        _InteractionLogWriter: Writer shared by all loggers of this file
+    """
+    path = os.path.abspath(log_file)
+    with _LOG_WRITERS_LOCK:
+        writer = _LOG_WRITERS.get(path)
+        if writer is None:
+            writer = _LOG_WRITERS[path] = _InteractionLogWriter(path)
+        writer._loggers += 1
+        return writer
+
+
+def _release_log_writer(writer: _InteractionLogWriter):
+    """
+    Release a logger's hold on a writer, closing it when no logger uses it anymore.
+    
+    Args:
+        writer: Writer returned by _acquire_log_writer
+    """
+    with _LOG_WRITERS_LOCK:
+        writer._loggers -= 1
+        if writer._loggers:
+            writer.flush()
+            return
+        del _LOG_WRITERS[writer.log_file]
+    writer.close()
+
+
+def _close_log_writers():
+    """Flush and close every open log writer at interpreter exit"""
+    with _LOG_WRITERS_LOCK:
+        writers = list(_LOG_WRITERS.values())
+        _LOG_WRITERS.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(_close_log_writers)
+
 
 class EnhancedLogger:
     def __init__(self):
@@ -178,10 +432,15 @@ class EnhancedLogger:
         Initialize enhanced logging system.
         
         Sets up file-based logging for user interactions and system events.
+        Entries are buffered in memory and written by a background thread,
+        so logging never blocks the request path on file I/O. Loggers of the
+        same file share that thread and its buffer.
         """
         self.log_file = "tutor_interactions.log"
+        self._writer: Optional[_InteractionLogWriter] = _acquire_log_writer(self.log_file)
     
-    def log_interaction(self, question: str, response: str, user_id: str):
+    def log_interaction(self, question: str, response: str, user_id: str,
+                        timestamp_ns: Optional[int] = None):
         """
         Log user interaction to file with timestamp and user information.
         
@@ -189,15 +448,29 @@ class EnhancedLogger:
             question: User's question (truncated to 100 chars)
             response: System's response (truncated to 100 chars)
             user_id: User identifier for tracking
+            timestamp_ns: Wall-clock time of the interaction from time.time_ns(). Defaults to now.
         """
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] User: {user_id} | Q: {question[:100]}... | R: {response[:100]}...\n"
-        
-        try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_entry)
-        except Exception as e:
-            print(f"Logging error: {e}")
+        if self._writer is None:
+            return  # Closed
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+        self._writer.append((timestamp_ns, user_id, question, response))
+    
+    def flush(self):
+        """
+        Write all buffered log entries to the log file.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+    
+    def close(self):
+        """
+        Flush pending entries and release the log file; its background thread
+        is stopped once no other logger is writing to it.
+        """
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            _release_log_writer(writer)
 
 # Enhanced TutorEngine wrapper
 class ProductionTutorEngine:
@@ -216,7 +489,10 @@ class ProductionTutorEngine:
         self.enhancements = ProductionEnhancements(knowledge_base_index)
         
         # Track conversation context for better follow-up detection
-        self.conversation_history = []
+        # (only the most recent interactions are kept)
+        self.conversation_history: Deque[Dict] = deque(maxlen=CONVERSATION_HISTORY_SIZE)
+        # Formatted context for the current history, rebuilt after it changes
+        self._conversation_context: Optional[str] = None
     
     def get_guidance(self, user_question: str, user_id: str = "default") -> str:
         """
@@ -233,12 +509,11 @@ class ProductionTutorEngine:
         if not self.enhancements.is_request_allowed(user_id):
             return "You're asking questions quite frequently. Please wait a moment before asking again."
         
-        # 2. Input validation
-        if not user_question or not user_question.strip():
+        # 2. Input validation (sanitized once, then reused by every check below)
+        user_question = user_question.strip() if user_question else ""
+        if not user_question:
             return "I'd be happy to help! Please ask me a question."
         
-        # Sanitize input
-        user_question = user_question.strip()
         if len(user_question) > 1000:
             return "Your question is quite long. Could you please break it down into smaller, more specific questions?"
         
@@ -253,20 +528,20 @@ class ProductionTutorEngine:
         except Exception as e:
             print(f"Pipeline error: {e}")
             response = "An unexpected error occurred. Please try again."
+        
+        # One clock reading shared by the history entry, log entry and metrics
+        completed_ns = time.time_ns()
  
         # Update conversation history
         self.conversation_history.append({
             'question': user_question,
             'response': response,
-            'timestamp': datetime.now()
+            'timestamp': datetime.fromtimestamp(completed_ns / 1e9)
         })
-        
-        # Keep only recent history (last 10 interactions)
-        if len(self.conversation_history) > 10:
-            self.conversation_history = self.conversation_history[-10:]
+        self._conversation_context = None
         
         # Log interaction
-        self.enhancements.log_interaction(user_question, response, user_id)
+        self.enhancements.log_interaction(user_question, response, user_id, completed_ns)
         
         return response
     
@@ -277,18 +552,15 @@ class ProductionTutorEngine:
         Returns:
             str: Formatted string containing recent conversation history
         """
-        if not self.conversation_history:
-            return ""
-        
-        # Return last 2-3 interactions as context
-        recent_interactions = self.conversation_history[-3:]
-        context_parts = []
-        
-        for interaction in recent_interactions:
-            context_parts.append(f"Q: {interaction['question'][:100]}")
-            context_parts.append(f"A: {interaction['response'][:100]}")
-        
-        return " | ".join(context_parts)
+        if self._conversation_context is None:
+            # Return last 2-3 interactions as context
+            history = self.conversation_history
+            recent_interactions = islice(history, max(len(history) - 3, 0), None)
+            self._conversation_context = " | ".join(
+                f"Q: {interaction['question'][:100]} | A: {interaction['response'][:100]}"
+                for interaction in recent_interactions
+            )
+        return self._conversation_context
     
     def reset(self):
         """
@@ -297,7 +569,8 @@ class ProductionTutorEngine:
         Delegates to base engine reset and clears conversation history.
         """
         self.engine.reset()
-        self.conversation_history = []
+        self.conversation_history.clear()
+        self._conversation_context = None
     
     def get_metrics(self) -> Dict:
         """
@@ -308,62 +581,63 @@ class ProductionTutorEngine:
         """
         return self.enhancements.metrics.get_summary()
 
-# Test the production enhancements
-def test_production_features():
-    """
-    Test all production enhancement features including rate limiting, safety checks, and metrics.
-    
-    Runs comprehensive tests to validate rate limiter, content safety detection,
-    and metrics collection functionality.
-    """
-    print("Testing Production Enhancement Features...")
-    
-    # Test rate limiter
-    print("\n1. Testing Rate Limiter:")
-    rate_limiter = RateLimiter(max_requests=3, time_window=10)
-    
-    for i in range(5):
-        allowed = rate_limiter.is_allowed("test_user")
-        print(f"  Request {i+1}: {'✅ Allowed' if allowed else '❌ Rate limited'}")
-    
-    # Test topic relevance
-    print("\n2. Testing Basic Safety Check:")
-    enhancements = ProductionEnhancements()
-    
-    test_questions = [
-        ("What is this concept?", "Safe"),
-        ("How do I bake a cake?", "Safe"),
-        ("What are the principles involved?", "Safe"),
-        ("What's the weather like?", "Safe"),
-        ("Can you explain more?", "Safe"),
-        ("This is harmful content", "Potentially Harmful"),
-        ("How does this process work?", "Safe")
-    ]
-    
-    for question, expected in test_questions:
-        is_harmful = enhancements.contains_harmful_content(question)
-        status = "✅" if (not is_harmful and expected == "Safe") or (is_harmful and expected == "Potentially Harmful") else "❌"
-        safety_status = "Safe" if not is_harmful else "Potentially Harmful"
-        print(f"  {status} '{question}' -> {safety_status} (Expected: {expected})")
-    
-    # Test metrics
-    print("\n3. Testing Metrics:")
-    metrics = ConversationMetrics()
-    
-    # Record some test interactions
-    test_interactions = [
-        ("What is sustainable design?", "Sustainable design is..."),
-        ("Tell me more", "Here are more details..."),
-        ("How about examples?", "Here are some examples...")
-    ]
-    
-    for q, r in test_interactions:
-        metrics.record_interaction(q, r)
-    
-    summary = metrics.get_summary()
-    print(f"  Metrics Summary: {summary}")
-    
-    print("\n✅ All production features tested successfully!")
-
+# Self-test, defined only when the module is run directly so that importing
+# it for production does not compile and keep the test code
 if __name__ == "__main__":
+    def test_production_features():
+        """
+        Test all production enhancement features including rate limiting, safety checks, and metrics.
+        
+        Runs comprehensive tests to validate rate limiter, content safety detection,
+        and metrics collection functionality.
+        """
+        print("Testing Production Enhancement Features...")
+        
+        # Test rate limiter
+        print("\n1. Testing Rate Limiter:")
+        rate_limiter = RateLimiter(max_requests=3, time_window=10)
+        
+        for i in range(5):
+            allowed = rate_limiter.is_allowed("test_user")
+            print(f"  Request {i+1}: {'✅ Allowed' if allowed else '❌ Rate limited'}")
+        
+        # Test topic relevance
+        print("\n2. Testing Basic Safety Check:")
+        enhancements = ProductionEnhancements()
+        
+        test_questions = [
+            ("What is this concept?", "Safe"),
+            ("How do I bake a cake?", "Safe"),
+            ("What are the principles involved?", "Safe"),
+            ("What's the weather like?", "Safe"),
+            ("Can you explain more?", "Safe"),
+            ("This is harmful content", "Potentially Harmful"),
+            ("How does this process work?", "Safe")
+        ]
+        
+        for question, expected in test_questions:
+            is_harmful = enhancements.contains_harmful_content(question)
+            status = "✅" if (not is_harmful and expected == "Safe") or (is_harmful and expected == "Potentially Harmful") else "❌"
+            safety_status = "Safe" if not is_harmful else "Potentially Harmful"
+            print(f"  {status} '{question}' -> {safety_status} (Expected: {expected})")
+        
+        # Test metrics
+        print("\n3. Testing Metrics:")
+        metrics = ConversationMetrics()
+        
+        # Record some test interactions
+        test_interactions = [
+            ("What is sustainable design?", "Sustainable design is..."),
+            ("Tell me more", "Here are more details..."),
+            ("How about examples?", "Here are some examples...")
+        ]
+        
+        for q, r in test_interactions:
+            metrics.record_interaction(q, r)
+        
+        summary = metrics.get_summary()
+        print(f"  Metrics Summary: {summary}")
+        
+        print("\n✅ All production features tested successfully!")
+
     test_production_features()
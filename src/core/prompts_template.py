@@ -1,5 +1,9 @@
+from functools import lru_cache
+
 from llama_index.core.prompts import PromptTemplate
 
+from .i18n import SUPPORTED_LANGUAGES
+
 
 # --- 1. JSON Generation Prompt ---
 # This prompt is used by the first LLM to structure the retrieved context 
@@ -196,6 +200,36 @@ Based on your analysis, classify the student's meta-question into ONE of the cat
 Intent: [Write ONLY the category name: clarification, process_question, concept_question, or confusion_frustration]"""
 )
 
+# --- Combined Stage 0 + Stage 0b Classifier Prompt ---
+# Classifies intent and, for follow-ups, the follow-up type in a single call
+# so the shared conversation context is only sent once.
+COMBINED_INTENT_CLASSIFIER_PROMPT = PromptTemplate(
+    """You are an AI assistant that classifies a student's latest input within a tutoring conversation.
+
+**Conversation History:**
+{conversation_history}
+
+**Tutor's Last Question:**
+{tutor_question}
+
+**Student's Current Input:**
+{user_input}
+
+---
+**Step 1 - Intent:**
+- Does the input answer the tutor's question or ask for clarification on the tutor's last point? -> **follow_up**
+- Does the input seem unrelated to the tutor's last message and introduce a new concept? -> **new_question**
+
+**Step 2 - Follow-up type (only if the intent is follow_up):**
+- Is the input a direct attempt to answer the tutor's question, even if short, simple, or incorrect? -> **answer**
+- Does the student say they don't know, ask for a hint or clarification, or express confusion? -> **meta_question**
+- If the intent is new_question -> **n/a**
+
+**Classification:**
+Respond with ONLY this JSON object and nothing else:
+{{"intent": "new_question or follow_up", "follow_up_type": "answer, meta_question or n/a"}}"""
+)
+
 # 🎯 IMPROVED: Friendly but Smart Adaptive Template
 ADAPTIVE_TUTOR_TEMPLATE = PromptTemplate(
      """---
@@ -311,6 +345,7 @@ def create_prompt_template_with_language(base_prompt_text:PromptTemplate, langua
         enhanced_text
     )
 
+@lru_cache(maxsize=None)
 def get_scaffolding_prompt(language: str = "en") -> PromptTemplate:
     """Returns the scaffolding prompt with language support."""
     language_instruction = get_language_instruction(language)
@@ -318,6 +353,7 @@ def get_scaffolding_prompt(language: str = "en") -> PromptTemplate:
     enhanced_text = f"{language_instruction}\n\n{base_text}"
     return PromptTemplate(enhanced_text)
 
+@lru_cache(maxsize=None)
 def get_json_context_prompt(language: str = "en") -> PromptTemplate:
     """Returns the JSON context prompt with the specified language."""
     return create_prompt_template_with_language(
@@ -326,6 +362,7 @@ def get_json_context_prompt(language: str = "en") -> PromptTemplate:
     )
 
 
+@lru_cache(maxsize=None)
 def get_enhanced_evaluation_prompt(language: str = "en") -> PromptTemplate:
     """Returns the enhanced evaluation prompt with the specified language."""
     language_instruction = get_enhanced_evaluation_language_instruction(language)
@@ -335,6 +372,7 @@ def get_enhanced_evaluation_prompt(language: str = "en") -> PromptTemplate:
         enhanced_text
     )
 
+@lru_cache(maxsize=None)
 def get_follow_up_type_classifier_prompt(language: str = "en") -> PromptTemplate:
     """Returns the follow-up type classifier prompt with the specified language."""
     language_instruction = get_classifier_language_instruction(language)
@@ -343,6 +381,7 @@ def get_follow_up_type_classifier_prompt(language: str = "en") -> PromptTemplate
     return PromptTemplate(
         enhanced_text
     )
+@lru_cache(maxsize=None)
 def get_intent_classifier_prompt(language: str = "en") -> PromptTemplate:
     """Returns the intent classifier prompt with the specified language."""
     language_instruction = get_classifier_language_instruction(language)
@@ -353,15 +392,28 @@ def get_intent_classifier_prompt(language: str = "en") -> PromptTemplate:
         
     )
 
+@lru_cache(maxsize=None)
+def get_combined_intent_prompt(language: str = "en") -> PromptTemplate:
+    """Returns the combined intent + follow-up type classifier prompt with the specified language."""
+    language_instruction = get_classifier_language_instruction(language)
+    base_text = COMBINED_INTENT_CLASSIFIER_PROMPT.template
+    enhanced_text = f"{language_instruction}\n\n{base_text}"
+    return PromptTemplate(
+        enhanced_text
+    )
+
+@lru_cache(maxsize=None)
 def get_meta_question_classifier_prompt(language:str = "en") -> PromptTemplate:
-    get_language_instruction = get_language_instruction(language)
+    """Returns the meta question classifier prompt with the specified language."""
+    language_instruction = get_language_instruction(language)
     base_text = META_QUESTION_CLASSIFIER_PROMPT.template
-    enhanced_text = f"{get_language_instruction}\n\n{base_text}"
+    enhanced_text = f"{language_instruction}\n\n{base_text}"
     return PromptTemplate(
         enhanced_text
     )
 
 # 🎯 NEW: Adaptive tutor template function with language support
+@lru_cache(maxsize=None)
 def get_adaptive_tutor_template(language: str = "en") -> PromptTemplate:
     """Returns adaptive tutor template with language instruction"""
     language_instruction = get_language_instruction(language)
@@ -487,4 +539,24 @@ def get_adaptive_strategy_instructions(strategy: str) -> str:
     return instructions.get(strategy, instructions["general_guidance"])
 
 
-
+def _prewarm_prompt_cache():
+    """
+    Build every language variant of the prompt templates once at import.
+    
+    The getters are memoized per language and their templates are shared and
+    read-only, so request paths only ever hit the cache.
+    """
+    for language in SUPPORTED_LANGUAGES:
+        for get_prompt in (
+            get_scaffolding_prompt,
+            get_json_context_prompt,
+            get_enhanced_evaluation_prompt,
+            get_follow_up_type_classifier_prompt,
+            get_intent_classifier_prompt,
+            get_combined_intent_prompt,
+            get_meta_question_classifier_prompt,
+            get_adaptive_tutor_template,
+        ):
+            get_prompt(language)
+
+_prewarm_prompt_cache()
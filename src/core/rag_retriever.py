@@ -25,6 +25,7 @@ from llama_index.llms.google_genai import GoogleGenAI
 from . import config
 from .models import ReasoningTriplet
 from .prompts_template import JSON_CONTEXT_PROMPT
+from .memory_manager import ROLE_LABELS
 
 
 class RAGRetriever:
@@ -164,8 +165,7 @@ class RAGRetriever:
             # Format recent messages for context
             history_messages = []
             for msg in recent_messages[-4:]:  # Last 4 messages for context
-                role = "Student" if msg.role == MessageRole.USER else "Tutor"
-                history_messages.append(f"{role}: {msg.content}")
+                history_messages.append(f"{ROLE_LABELS.get(msg.role, 'Tutor')}: {msg.content}")
             
             conversation_history_str = "\n".join(history_messages)
             
@@ -295,11 +295,21 @@ class TutorEngine:
             self.memory_manager.add_user_message(user_question)
             
             # Stage 0: Intent Classification (State → Operator)
-            intent = self.intent_classifier.classify_intent(
-                user_question, 
-                self.memory_manager.memory,
-                language
-            )
+            follow_up_type = None
+            if self.memory_manager.has_cached_context():
+                # Stage 0b only depends on the conversation, so classify it
+                # in the same LLM call as Stage 0
+                intent, follow_up_type = await self.intent_classifier.aclassify_both(
+                    user_question, 
+                    self.memory_manager,
+                    language
+                )
+            else:
+                intent = await self.intent_classifier.aclassify_intent(
+                    user_question, 
+                    self.memory_manager,
+                    language
+                )
             print(f"DEBUG: Classified intent (Stage 0) as: {intent}", flush=True)
             
             # Route to appropriate pipeline (And)
@@ -308,7 +318,7 @@ class TutorEngine:
                 response = self._pipeline_new_question(user_question, language)
             else:  # follow_up
                 print("DEBUG: Executing pipeline: follow_up", flush=True)
-                response = self._pipeline_follow_up(user_question, language)
+                response = self._pipeline_follow_up(user_question, language, follow_up_type)
 
             # Add response to memory and return (Result)
             self.memory_manager.add_assistant_message(response)
@@ -395,7 +405,7 @@ class TutorEngine:
             print(f"New question pipeline error: {e}")
             return get_ui_text("engine_processing_error", self.language)
 
-    def _pipeline_follow_up(self, user_question: str, language: str = "en") -> str:
+    def _pipeline_follow_up(self, user_question: str, language: str = "en", follow_up_type: Optional[str] = None) -> str:
         """
         Pipeline for handling follow-up responses from students.
         
@@ -405,6 +415,7 @@ class TutorEngine:
         Args:
             user_question: Follow-up response from student
             language: Language code for response generation
+            follow_up_type: Stage 0b result if it was already classified
             
         Returns:
             str: Contextually appropriate tutor response
@@ -418,11 +429,12 @@ class TutorEngine:
                 return self._pipeline_new_question(user_question, language)
 
             # Stage 0b: Classify follow-up type
-            follow_up_type = self.intent_classifier.classify_follow_up_type(
-                user_question, 
-                self.memory_manager.memory,
-                language
-            )
+            if follow_up_type is None:
+                follow_up_type = self.intent_classifier.classify_follow_up_type(
+                    user_question, 
+                    self.memory_manager,
+                    language
+                )
             print(f"DEBUG: Classified follow-up type (Stage 0b) as: {follow_up_type}")
             
             if follow_up_type == "answer":
@@ -788,8 +800,10 @@ class TutorEngine:
             from .persistence import create_index_from_files
           
             
-            # Create user-specific index directory
-            user_index_dir = os.path.join(config.USER_INDEXES_DIR, str(uuid.uuid4()))
+            # User-specific index directory, derived from the session and the documents
+            # being indexed so that retrying an interrupted upload resumes its build
+            file_set_hash = hashlib.sha256("\n".join(sorted(file_hashes)).encode("utf-8")).hexdigest()[:16]
+            user_index_dir = os.path.join(config.USER_INDEXES_DIR, f"{self.session_id}_{file_set_hash}")
             
             yield {
                 "key": "engine_index_creation_start",
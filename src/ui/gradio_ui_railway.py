@@ -30,7 +30,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.tutor_engine import TutorEngine
 from core.database_manager import DatabaseManager
-from core.i18n import get_ui_text, UI_TEXTS
+from core.i18n import get_ui_text, get_ui_text_formatted, get_ui_text_getter, LANGUAGE_NAMES
 
 # --- Global variables and Session Management (Unchanged) ---
 user_sessions = {}
@@ -103,7 +103,8 @@ def handle_file_upload_staging(files, lang='en'):
     file_names = [os.path.basename(file.name) for file in files]
     
     # Use translated strings
-    staged_msg = get_ui_text('files_staged', lang).format(
+    staged_msg = get_ui_text_formatted(
+        'files_staged', lang,
         count=len(files),
         filenames='\n'.join([f" - {name}" for name in file_names])
     )
@@ -161,9 +162,9 @@ async def save_and_create_index(staged_files, lang='en'):
 
         yield f"\n{get_ui_text('index_creation_step2', lang)}"
         async for result_dict in engine.create_user_index():
-            status_message = get_ui_text(
-                result_dict["key"], lang
-            ).format(**result_dict["params"])
+            status_message = get_ui_text_formatted(
+                result_dict["key"], lang, **result_dict["params"]
+            )
             yield status_message
 
     except Exception as e:
@@ -201,7 +202,7 @@ def get_session_status(lang='en'):
         return "".join([
             f"{get_ui_text('session_id_prefix', lang)}: {session_info['session_id'][:8]}...\n",
             f"{get_ui_text('documents_prefix', lang)}: {status_info.get('documents_count', 0)} {get_ui_text('documents_uploaded_suffix', lang)}, {status_info.get('indexed_count', 0)} {get_ui_text('documents_indexed_suffix', lang)}\n",
-            f"{get_ui_text('engine_status_prefix', lang)}: {get_ui_text('engine_ready', lang) if status_info.get('engine_ready',False) else get_ui_text('engine_not_ready', lang)}\n",
+            f"{get_ui_text('engine_status_prefix', lang)}: {get_ui_text('engine_ready', lang) if status_info.get('engine_ready',False) else get_ui_text('engine_status_not_ready', lang)}\n",
             f"{get_ui_text('created_at_prefix', lang)}: {session_info.get('user_created', get_ui_text('unknown', lang))}\n"
         ])
     except Exception as e:
@@ -294,7 +295,7 @@ def new_session(lang='en'):
     user_sessions[new_session_id] = TutorEngine(session_id=new_session_id)
     print(f"Eagerly created new session and engine for: {new_session_id}")
 
-    session_created_msg = get_ui_text('session_created', lang).format(session_id=new_session_id[:8])
+    session_created_msg = get_ui_text_formatted('session_created', lang, session_id=new_session_id[:8])
     return [], session_created_msg, "", ""
 
 def reset_conversation(lang='en'):
@@ -433,14 +434,14 @@ async def handle_load_index_click(index_id, lang='en'):
     if "key" in result_dict:
         params = result_dict.get("params", {})
         try:
-            final_message = get_ui_text(result_dict["key"], lang).format(**params)
+            final_message = get_ui_text_formatted(result_dict["key"], lang, **params)
         except (TypeError, KeyError) as e:
             print(f"Missing i18n key: {result_dict['key']}")
             # 기본 메시지 사용
-            final_message = get_ui_text('engine_load_success', lang).format(count="N/A")
+            final_message = get_ui_text_formatted('engine_load_success', lang, count="N/A")
     else:
         # 예상치 못한 응답 구조
-        final_message = get_ui_text('engine_load_success', lang).format(count="N/A")
+        final_message = get_ui_text_formatted('engine_load_success', lang, count="N/A")
     
     return final_message
 
@@ -462,46 +463,47 @@ def get_session_insights_display(lang='en'):
     """
     global current_session_id
     
+    ui_text = get_ui_text_getter(lang)
     engine = get_or_create_session(current_session_id, lang)
     if not engine:
-        return f"❌ {get_ui_text('insights_error', lang)}"
+        return f"❌ {ui_text('insights_error')}"
     
     try:
         insights = engine.get_learning_insights()
         
         if "error" in insights:
-            return f"❌ {get_ui_text('insights_error', lang)}: {insights['error']}"
+            return f"❌ {ui_text('insights_error')}: {insights['error']}"
         
         # Build formatted display
-        display_lines = [f"# {get_ui_text('learning_insights_header', lang)}\n"]
+        display_lines = [f"# {ui_text('learning_insights_header')}\n"]
         
         # Basic info section
         display_lines.extend([
-            f"🎯 **{get_ui_text('current_level_label', lang)}:** {insights.get('current_level', 'Unknown')}\n",
-            f"📝 **{get_ui_text('level_description_label', lang)}:** {insights.get('level_description', 'N/A')}\n",
-            f"💬 **{get_ui_text('total_interactions_label', lang)}:** {insights.get('total_interactions', 0)}\n",
-            f"⏱️ **{get_ui_text('session_duration_label', lang)}:** {insights.get('session_duration_minutes', 0)} {get_ui_text('minutes_unit', lang)}\n",
+            f"🎯 **{ui_text('current_level_label')}:** {insights.get('current_level', 'Unknown')}\n",
+            f"📝 **{ui_text('level_description_label')}:** {insights.get('level_description', 'N/A')}\n",
+            f"💬 **{ui_text('total_interactions_label')}:** {insights.get('total_interactions', 0)}\n",
+            f"⏱️ **{ui_text('session_duration_label')}:** {insights.get('session_duration_minutes', 0)} {ui_text('minutes_unit')}\n",
             ""
         ])
 
         # Recent performance section
-        display_lines.append(f"## {get_ui_text('recent_performance_header', lang)}\n")
+        display_lines.append(f"## {ui_text('recent_performance_header')}\n")
 
         recent_perf = insights.get("recent_performance")
         if recent_perf:
             trend_key = f"trend_{recent_perf['score_trend']}"
-            trend_text = get_ui_text(trend_key, lang)
+            trend_text = ui_text(trend_key)
             
             display_lines.extend([
-                f"• **{get_ui_text('average_score_label', lang)}:** {recent_perf['average_score']:.2f}\n",
-                f"• **{get_ui_text('latest_score_label', lang)}:** {recent_perf['latest_score']:.2f}\n",
-                f"• **{get_ui_text('performance_trend_label', lang)}:** {trend_text}\n",
-                f"• **{get_ui_text('evaluations_count_label', lang)}:** {recent_perf['scores_count']}\n",
+                f"• **{ui_text('average_score_label')}:** {recent_perf['average_score']:.2f}\n",
+                f"• **{ui_text('latest_score_label')}:** {recent_perf['latest_score']:.2f}\n",
+                f"• **{ui_text('performance_trend_label')}:** {trend_text}\n",
+                f"• **{ui_text('evaluations_count_label')}:** {recent_perf['scores_count']}\n",
                 ""
             ])
         else:
             display_lines.extend([
-                f"*{get_ui_text('no_performance_data', lang)}*",
+                f"*{ui_text('no_performance_data')}*",
                 ""
             ])
 
@@ -509,32 +511,32 @@ def get_session_insights_display(lang='en'):
         perf_streaks = insights.get("performance_streaks")
         if perf_streaks:
             display_lines.extend([
-                f"## {get_ui_text('performance_streaks_header', lang)}",
-                f"• **{get_ui_text('consecutive_high_label', lang)}:** {perf_streaks['consecutive_high']}\n",
-                f"• **{get_ui_text('consecutive_low_label', lang)}:** {perf_streaks['consecutive_low']}\n",
-                f"• **{get_ui_text('stability_at_level_label', lang)}:** {perf_streaks['stability_at_level']}\n",
+                f"## {ui_text('performance_streaks_header')}",
+                f"• **{ui_text('consecutive_high_label')}:** {perf_streaks['consecutive_high']}\n",
+                f"• **{ui_text('consecutive_low_label')}:** {perf_streaks['consecutive_low']}\n",
+                f"• **{ui_text('stability_at_level_label')}:** {perf_streaks['stability_at_level']}\n",
                 ""
             ])
 
         # Level progression section  
-        display_lines.append(f"## {get_ui_text('level_progression_header', lang)}")
+        display_lines.append(f"## {ui_text('level_progression_header')}")
         
         level_prog = insights.get("level_progression")
         if level_prog:
             last_change = level_prog["last_change"]
             display_lines.extend([
-                f"• **{get_ui_text('last_level_change_label', lang)}:** {last_change['from']} → {last_change['to']}\n",
+                f"• **{ui_text('last_level_change_label')}:** {last_change['from']} → {last_change['to']}\n",
                 f"• **Reason:** {last_change['reason']}\n",
                 f"• **Score:** {last_change['score']:.2f}\n",
-                f"• **{get_ui_text('total_level_changes_label', lang)}:** {level_prog['total_changes']}\n"
+                f"• **{ui_text('total_level_changes_label')}:** {level_prog['total_changes']}\n"
             ])
         else:
-            display_lines.append(f"*{get_ui_text('no_level_changes', lang)}*")
+            display_lines.append(f"*{ui_text('no_level_changes')}*")
         
         return "\n".join(display_lines)
         
     except Exception as e:
-        return f"❌ {get_ui_text('insights_error', lang)}: {str(e)}"
+        return f"❌ {ui_text('insights_error')}: {str(e)}"
 
 def create_gradio_interface():
     """
@@ -610,7 +612,7 @@ def create_gradio_interface():
                         session_status_btn = gr.Button(get_ui_text('refresh_status_btn','en'), variant="secondary")
                         
                         language_choices = [
-                        (data['language_name'], lang) for lang, data in UI_TEXTS.items()
+                        (name, lang) for lang, name in LANGUAGE_NAMES.items()
                         ]
 
                         language_dropdown = gr.Dropdown(
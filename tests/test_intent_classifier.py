@@ -0,0 +1,67 @@
+"""
+Tests for the Stage 0 intent heuristic, using tutor messages of realistic length
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src to Python path (as in main.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+pytest.importorskip("llama_index.llms.google_genai")
+
+from core.intent_classifier import IntentClassifier  # noqa: E402
+
+
+# A typical Socratic tutor reply (about 50 words)
+BEAM_TUTOR_MESSAGE = (
+    "Good thinking! When the beam bends under the load, its top fibres are pushed together "
+    "while the bottom fibres are stretched apart. Before we go further, can you explain in "
+    "your own words which part of the beam is in compression, and why that might matter "
+    "for the material we choose?"
+)
+
+PHOTOSYNTHESIS_TUTOR_MESSAGE = (
+    "Exactly, the light-dependent reactions take place in the thylakoid membranes and they "
+    "produce ATP and NADPH. Now think about what the plant does with those two molecules "
+    "afterwards. Where in the chloroplast do you think the carbon from carbon dioxide is "
+    "fixed into sugars, and what would happen if the light suddenly stopped?"
+)
+
+
+@pytest.fixture
+def classifier():
+    # The heuristic needs no LLM client, so skip __init__
+    return IntentClassifier.__new__(IntentClassifier)
+
+
+@pytest.mark.parametrize("user_input, tutor_message", [
+    ("Why does the top get compressed?", BEAM_TUTOR_MESSAGE),
+    ("Which material handles compression better?", BEAM_TUTOR_MESSAGE),
+    ("Where is the carbon fixed in the chloroplast?", PHOTOSYNTHESIS_TUTOR_MESSAGE),
+    ("What happens to NADPH when the light stops?", PHOTOSYNTHESIS_TUTOR_MESSAGE),
+])
+def test_on_topic_question_is_not_declared_new(classifier, user_input, tutor_message):
+    assert classifier._heuristic_intent(user_input, tutor_message, "en") is None
+
+
+@pytest.mark.parametrize("user_input, tutor_message", [
+    ("What is the capital of France?", BEAM_TUTOR_MESSAGE),
+    ("How do neural networks learn their weights?", PHOTOSYNTHESIS_TUTOR_MESSAGE),
+])
+def test_unrelated_question_is_new(classifier, user_input, tutor_message):
+    assert classifier._heuristic_intent(user_input, tutor_message, "en") == "new_question"
+
+
+def test_unrelated_question_defers_to_llm_with_cached_topic(classifier):
+    intent = classifier._heuristic_intent(
+        "What is the capital of France?", BEAM_TUTOR_MESSAGE, "en", has_topic_context=True
+    )
+    assert intent is None
+
+
+@pytest.mark.parametrize("user_input", ["ok", "Yes, thanks", "sì certo"])
+def test_acknowledgement_is_follow_up(classifier, user_input):
+    assert classifier._heuristic_intent(user_input, BEAM_TUTOR_MESSAGE, "en") == "follow_up"